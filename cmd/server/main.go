@@ -41,6 +41,8 @@ func run() error {
 		slog.String("log_level", cfg.LogLevel),
 		slog.String("temp_dir", cfg.TempDir),
 		slog.Int("chunk_target_sec", cfg.ChunkTargetSec),
+		slog.Int("max_concurrent_chunks", cfg.MaxConcurrentChunks),
+		slog.Int("chunk_max_attempts", cfg.ChunkMaxAttempts),
 		slog.Bool("s3_enabled", cfg.S3Enabled()),
 		slog.Bool("beam_enabled", cfg.BeamEnabled()),
 		slog.String("runpod_endpoint_id", cfg.RunPodEndpointID),
@@ -1,17 +1,22 @@
 package audio
 
 import (
+	"bufio"
 	"bytes"
 	"context"
 	"errors"
 	"fmt"
+	"io"
+	"math"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"regexp"
+	"runtime"
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 )
 
 // Static errors for audio operations.
@@ -24,6 +29,8 @@ var (
 	ErrInvalidWAVFormat = errors.New("invalid WAV format: expected pcm_s16le codec")
 	// ErrInvalidDuration is returned when a chunk has an invalid duration.
 	ErrInvalidDuration = errors.New("invalid chunk duration")
+	// ErrParseVolume is returned when the mean volume cannot be parsed from ffmpeg output.
+	ErrParseVolume = errors.New("could not parse mean volume from ffmpeg output")
 )
 
 // codecPCM16LE is the expected codec name for valid WAV chunks.
@@ -38,6 +45,14 @@ var (
 	reDuration   = regexp.MustCompile(`"duration"\s*:\s*"?([\d.]+)"?`)
 )
 
+// Pre-compiled regular expressions for ffmpeg stderr parsing.
+var (
+	reInputDuration = regexp.MustCompile(`Duration:\s*(\d+):(\d+):(\d+)\.(\d+)`)
+	reSilenceStart  = regexp.MustCompile(`silence_start:\s*([\d.]+)`)
+	reSilenceEnd    = regexp.MustCompile(`silence_end:\s*([\d.]+)`)
+	reMeanVolume    = regexp.MustCompile(`mean_volume:\s*(-?[\d.]+|-inf) dB`)
+)
+
 // SilenceInterval represents a detected silence interval in the audio.
 type SilenceInterval struct {
 	Start float64
@@ -93,10 +108,10 @@ func (s *FFmpegSplitter) Split(ctx context.Context, inputWav, outputDir string,
 		return nil, fmt.Errorf("%w: %s", ErrInputNotFound, inputWav)
 	}
 
-	// Get audio duration
-	duration, err := s.getAudioDuration(ctx, inputWav)
+	// Get duration and silence intervals in a single decoding pass
+	duration, silences, err := s.analyzeAudio(ctx, inputWav, opts)
 	if err != nil {
-		return nil, fmt.Errorf("get audio duration: %w", err)
+		return nil, fmt.Errorf("analyze audio: %w", err)
 	}
 
 	// If audio is shorter than or equal to target, return single file
@@ -108,17 +123,11 @@ func (s *FFmpegSplitter) Split(ctx context.Context, inputWav, outputDir string,
 		return []string{outputPath}, nil
 	}
 
-	// Detect silence intervals
-	silences, err := s.detectSilences(ctx, inputWav, opts)
-	if err != nil {
-		return nil, fmt.Errorf("detect silences: %w", err)
-	}
-
 	// Calculate split points based on target chunk duration
 	splitPoints := s.calculateSplitPoints(silences, duration, opts.ChunkTargetSec)
 
 	// Extract chunks
-	chunks, err := s.extractChunks(ctx, inputWav, outputDir, splitPoints, duration)
+	chunks, err := s.extractChunks(ctx, inputWav, outputDir, buildSegments(splitPoints, duration))
 	if err != nil {
 		return nil, fmt.Errorf("extract chunks: %w", err)
 	}
@@ -126,48 +135,11 @@ func (s *FFmpegSplitter) Split(ctx context.Context, inputWav, outputDir string,
 	return chunks, nil
 }
 
-// getAudioDuration returns the duration of an audio file in seconds.
-func (s *FFmpegSplitter) getAudioDuration(ctx context.Context, inputPath string) (float64, error) {
-	// #nosec G204 - ffmpegPath is set by the application, not user input
-	cmd := exec.CommandContext(ctx, s.ffmpegPath,
-		"-i", inputPath,
-		"-hide_banner",
-		"-f", "null", "-",
-	)
-
-	var stderr bytes.Buffer
-	cmd.Stderr = &stderr
-
-	// ffmpeg writes duration info to stderr and exits with error code when output is null.
-	// We capture stderr to extract duration regardless of exit code, but we still check
-	// if we can parse the duration (missing duration indicates an actual error).
-	_ = cmd.Run()
-
-	// Parse duration from stderr
-	// Looking for: "Duration: HH:MM:SS.ms"
-	output := stderr.String()
-	re := regexp.MustCompile(`Duration:\s*(\d+):(\d+):(\d+)\.(\d+)`)
-	matches := re.FindStringSubmatch(output)
-	if len(matches) < 5 {
-		return 0, fmt.Errorf("%w: %s", ErrParseDuration, output)
-	}
-
-	hours, _ := strconv.ParseFloat(matches[1], 64)
-	minutes, _ := strconv.ParseFloat(matches[2], 64)
-	seconds, _ := strconv.ParseFloat(matches[3], 64)
-	ms, _ := strconv.ParseFloat(matches[4], 64)
-
-	// Convert milliseconds - handle different precision
-	msDivisor := 1.0
-	for i := 0; i < len(matches[4]); i++ {
-		msDivisor *= 10
-	}
-
-	return hours*3600 + minutes*60 + seconds + ms/msDivisor, nil
-}
-
-// detectSilences uses ffmpeg silencedetect to find silence intervals.
-func (s *FFmpegSplitter) detectSilences(ctx context.Context, inputPath string, opts SplitOpts) ([]SilenceInterval, error) {
+// analyzeAudio decodes the input once with the silencedetect filter and returns
+// the total duration together with the detected silence intervals.
+// The ffmpeg stderr stream is parsed line by line as it is produced, so the
+// output is never buffered in full.
+func (s *FFmpegSplitter) analyzeAudio(ctx context.Context, inputPath string, opts SplitOpts) (float64, []SilenceInterval, error) {
 	// Build silencedetect filter
 	filter := fmt.Sprintf("silencedetect=noise=%ddB:d=%f",
 		int(opts.SilenceThreshDB),
@@ -176,37 +148,77 @@ func (s *FFmpegSplitter) detectSilences(ctx context.Context, inputPath string, o
 
 	// #nosec G204 - ffmpegPath is set by the application, not user input
 	cmd := exec.CommandContext(ctx, s.ffmpegPath,
+		"-hide_banner",
+		"-nostats", // Suppress progress lines, only filter output is needed
 		"-i", inputPath,
 		"-af", filter,
 		"-f", "null",
-		"-hide_banner",
 		"-",
 	)
 
-	var stderr bytes.Buffer
-	cmd.Stderr = &stderr
+	stderr, err := cmd.StderrPipe()
+	if err != nil {
+		return 0, nil, fmt.Errorf("ffmpeg stderr pipe: %w", err)
+	}
+	if err := cmd.Start(); err != nil {
+		return 0, nil, fmt.Errorf("ffmpeg start: %w", err)
+	}
+
+	duration, silences, lastLine, scanErr := scanAnalysisOutput(stderr)
+	// Drain whatever the scanner left unread (e.g. after an overlong line) so
+	// ffmpeg never blocks on a full pipe and Wait can return
+	_, _ = io.Copy(io.Discard, stderr)
+
+	// ffmpeg may exit with an error code when the output is null. The parsed
+	// duration tells us whether the input was actually readable.
+	_ = cmd.Wait()
 
-	// ffmpeg writes silencedetect output to stderr and exits with error when output is null.
-	// We capture stderr to extract silence intervals regardless of exit code.
-	_ = cmd.Run()
+	if scanErr != nil {
+		return 0, nil, fmt.Errorf("read ffmpeg output: %w", scanErr)
+	}
+	if duration <= 0 {
+		return 0, nil, fmt.Errorf("%w: %s", ErrParseDuration, lastLine)
+	}
 
-	return parseSilenceOutput(stderr.String())
+	return duration, silences, nil
 }
 
-// parseSilenceOutput parses ffmpeg silencedetect output.
-func parseSilenceOutput(output string) ([]SilenceInterval, error) {
-	var intervals []SilenceInterval
+// detectSilences uses ffmpeg silencedetect to find silence intervals.
+func (s *FFmpegSplitter) detectSilences(ctx context.Context, inputPath string, opts SplitOpts) ([]SilenceInterval, error) {
+	_, silences, err := s.analyzeAudio(ctx, inputPath, opts)
+	if err != nil {
+		return nil, err
+	}
+	return silences, nil
+}
 
-	// Regex patterns for silence start and end
-	startRe := regexp.MustCompile(`silence_start:\s*([\d.]+)`)
-	endRe := regexp.MustCompile(`silence_end:\s*([\d.]+)`)
+// scanAnalysisOutput parses ffmpeg stderr for the input duration and
+// silencedetect intervals. It also returns the last non-empty line, which
+// usually carries the ffmpeg error message when the input is unreadable.
+func scanAnalysisOutput(r io.Reader) (float64, []SilenceInterval, string, error) {
+	var (
+		duration     float64
+		intervals    []SilenceInterval
+		lastLine     string
+		currentStart float64
+		hasStart     bool
+	)
 
-	lines := strings.Split(output, "\n")
-	var currentStart float64
-	hasStart := false
+	scanner := bufio.NewScanner(r)
+	for scanner.Scan() {
+		line := scanner.Text()
+		if strings.TrimSpace(line) != "" {
+			lastLine = line
+		}
 
-	for _, line := range lines {
-		if startMatch := startRe.FindStringSubmatch(line); len(startMatch) > 1 {
+		if duration == 0 {
+			if d, ok := parseDurationLine(line); ok {
+				duration = d
+				continue
+			}
+		}
+
+		if startMatch := reSilenceStart.FindStringSubmatch(line); len(startMatch) > 1 {
 			val, err := strconv.ParseFloat(startMatch[1], 64)
 			if err != nil {
 				continue
@@ -215,7 +227,7 @@ func parseSilenceOutput(output string) ([]SilenceInterval, error) {
 			hasStart = true
 		}
 
-		if endMatch := endRe.FindStringSubmatch(line); len(endMatch) > 1 && hasStart {
+		if endMatch := reSilenceEnd.FindStringSubmatch(line); len(endMatch) > 1 && hasStart {
 			val, err := strconv.ParseFloat(endMatch[1], 64)
 			if err != nil {
 				continue
@@ -228,7 +240,29 @@ func parseSilenceOutput(output string) ([]SilenceInterval, error) {
 		}
 	}
 
-	return intervals, nil
+	return duration, intervals, lastLine, scanner.Err()
+}
+
+// parseDurationLine extracts the duration in seconds from an ffmpeg
+// "Duration: HH:MM:SS.ms" line.
+func parseDurationLine(line string) (float64, bool) {
+	matches := reInputDuration.FindStringSubmatch(line)
+	if len(matches) < 5 {
+		return 0, false
+	}
+
+	hours, _ := strconv.ParseFloat(matches[1], 64)
+	minutes, _ := strconv.ParseFloat(matches[2], 64)
+	seconds, _ := strconv.ParseFloat(matches[3], 64)
+	ms, _ := strconv.ParseFloat(matches[4], 64)
+
+	// Convert milliseconds - handle different precision
+	msDivisor := 1.0
+	for i := 0; i < len(matches[4]); i++ {
+		msDivisor *= 10
+	}
+
+	return hours*3600 + minutes*60 + seconds + ms/msDivisor, true
 }
 
 // calculateSplitPoints determines optimal split points based on silence intervals.
@@ -239,17 +273,17 @@ func (s *FFmpegSplitter) calculateSplitPoints(silences []SilenceInterval, totalD
 	}
 
 	target := float64(targetSec)
+	midpoints := silenceMidpoints(silences)
 	var splitPoints []float64
 	lastSplit := 0.0
 
 	for lastSplit < totalDuration-target/2 {
 		// Find the best silence boundary near the target
 		idealPoint := lastSplit + target
-		bestSilence := findBestSilence(silences, idealPoint, target/3) // Allow 1/3 deviation
+		splitPoint, found := findBestSilence(midpoints, idealPoint, target/3) // Allow 1/3 deviation
 
-		if bestSilence != nil {
+		if found {
 			// Split at the middle of the silence
-			splitPoint := (bestSilence.Start + bestSilence.End) / 2
 			if splitPoint > lastSplit+1 { // Ensure some minimum chunk size
 				splitPoints = append(splitPoints, splitPoint)
 				lastSplit = splitPoint
@@ -284,31 +318,39 @@ func (s *FFmpegSplitter) fixedSplitPoints(totalDuration float64, targetSec int)
 	return points
 }
 
-// findBestSilence finds the silence interval closest to the ideal point within tolerance.
-func findBestSilence(silences []SilenceInterval, idealPoint, tolerance float64) *SilenceInterval {
-	var best *SilenceInterval
+// silenceMidpoints returns the middle of each silence interval. Split points
+// are only ever placed at silence midpoints, so they are computed once up front.
+func silenceMidpoints(silences []SilenceInterval) []float64 {
+	midpoints := make([]float64, len(silences))
+	for i, sil := range silences {
+		midpoints[i] = (sil.Start + sil.End) / 2
+	}
+	return midpoints
+}
+
+// findBestSilence finds the silence midpoint closest to the ideal point within
+// tolerance. It reports false if no silence is close enough.
+func findBestSilence(midpoints []float64, idealPoint, tolerance float64) (float64, bool) {
+	best, found := 0.0, false
 	bestDistance := tolerance
 
-	for i := range silences {
-		// Use the middle of the silence as reference
-		silenceMiddle := (silences[i].Start + silences[i].End) / 2
+	// Silences are sorted by time, so binary search for the first candidate
+	// instead of rescanning from the beginning for every split point.
+	first := sort.SearchFloat64s(midpoints, idealPoint-tolerance)
 
-		// Only consider silences after some minimum point
-		if silenceMiddle < idealPoint-tolerance {
-			continue
-		}
-		if silenceMiddle > idealPoint+tolerance {
+	for _, middle := range midpoints[first:] {
+		if middle > idealPoint+tolerance {
 			break // Silences are sorted by time
 		}
 
-		distance := abs(silenceMiddle - idealPoint)
+		distance := abs(middle - idealPoint)
 		if distance < bestDistance {
 			bestDistance = distance
-			best = &silences[i]
+			best, found = middle, true
 		}
 	}
 
-	return best
+	return best, found
 }
 
 func abs(x float64) float64 {
@@ -318,14 +360,9 @@ func abs(x float64) float64 {
 	return x
 }
 
-// extractChunks creates audio chunk files based on split points.
-func (s *FFmpegSplitter) extractChunks(ctx context.Context, inputPath, outputDir string, splitPoints []float64, totalDuration float64) ([]string, error) {
-	// Create output directory if it doesn't exist
-	if err := os.MkdirAll(outputDir, 0750); err != nil {
-		return nil, fmt.Errorf("create output directory: %w", err)
-	}
-
-	// Build segment boundaries
+// buildSegments turns split points into (start, end) segment boundaries
+// covering the whole audio.
+func buildSegments(splitPoints []float64, totalDuration float64) [][2]float64 {
 	segments := make([][2]float64, 0, len(splitPoints)+1)
 	start := 0.0
 	for _, point := range splitPoints {
@@ -333,21 +370,71 @@ func (s *FFmpegSplitter) extractChunks(ctx context.Context, inputPath, outputDir
 		start = point
 	}
 	// Add final segment
-	segments = append(segments, [2]float64{start, totalDuration})
+	return append(segments, [2]float64{start, totalDuration})
+}
+
+// extractChunks creates one audio chunk file per segment.
+func (s *FFmpegSplitter) extractChunks(ctx context.Context, inputPath, outputDir string, segments [][2]float64) ([]string, error) {
+	// Create output directory if it doesn't exist
+	if err := os.MkdirAll(outputDir, 0750); err != nil {
+		return nil, fmt.Errorf("create output directory: %w", err)
+	}
+
+	// Extract segments concurrently; each ffmpeg process is independent.
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	var (
+		wg       sync.WaitGroup
+		mu       sync.Mutex
+		firstErr error
+		sem      = make(chan struct{}, runtime.NumCPU())
+		chunks   = make([]string, len(segments))
+	)
 
-	chunks := make([]string, 0, len(segments))
 	for i, seg := range segments {
-		outputPath := filepath.Join(outputDir, fmt.Sprintf("chunk_%03d.wav", i))
+		chunks[i] = filepath.Join(outputDir, fmt.Sprintf("chunk_%03d.wav", i))
+
+		wg.Add(1)
+		go func(i int, seg [2]float64) {
+			defer wg.Done()
 
-		if err := s.extractSegment(ctx, inputPath, outputPath, seg[0], seg[1]-seg[0]); err != nil {
-			// Cleanup already created chunks on error (best-effort, ignore errors)
-			for _, chunk := range chunks {
-				_ = os.Remove(chunk)
+			select {
+			case sem <- struct{}{}:
+				defer func() { <-sem }()
+			case <-ctx.Done():
+				return
 			}
-			return nil, fmt.Errorf("extract segment %d: %w", i, err)
-		}
+			// select picks randomly when both are ready; don't start ffmpeg
+			// after cancellation
+			if ctx.Err() != nil {
+				return
+			}
+
+			if err := s.extractSegment(ctx, inputPath, chunks[i], seg[0], seg[1]-seg[0]); err != nil {
+				mu.Lock()
+				if firstErr == nil {
+					firstErr = fmt.Errorf("extract segment %d: %w", i, err)
+					cancel()
+				}
+				mu.Unlock()
+			}
+		}(i, seg)
+	}
+	wg.Wait()
+
+	// Segments still waiting for a slot when the parent context was cancelled
+	// return without an error and without writing their chunk
+	if firstErr == nil && ctx.Err() != nil {
+		firstErr = fmt.Errorf("extract chunks cancelled: %w", ctx.Err())
+	}
 
-		chunks = append(chunks, outputPath)
+	if firstErr != nil {
+		// Cleanup created chunks on error (best-effort, ignore errors)
+		for _, chunk := range chunks {
+			_ = os.Remove(chunk)
+		}
+		return nil, firstErr
 	}
 
 	return chunks, nil
@@ -586,6 +673,45 @@ func (s *FFmpegSplitter) GetSilences(ctx context.Context, inputPath string, opts
 	return s.detectSilences(ctx, inputPath, opts)
 }
 
+// MeanVolume returns the mean volume of an audio file in dBFS, as measured by
+// ffmpeg's volumedetect filter. Digital silence reports about -91 dB.
+func (s *FFmpegSplitter) MeanVolume(ctx context.Context, inputPath string) (float64, error) {
+	// #nosec G204 - ffmpegPath is set by the application, not user input
+	cmd := exec.CommandContext(ctx, s.ffmpegPath,
+		"-hide_banner",
+		"-nostats",
+		"-i", inputPath,
+		"-af", "volumedetect",
+		"-f", "null",
+		"-",
+	)
+
+	var stderr bytes.Buffer
+	cmd.Stderr = &stderr
+
+	if err := cmd.Run(); err != nil {
+		return 0, fmt.Errorf("ffmpeg error: %w, stderr: %s", err, stderr.String())
+	}
+
+	return parseMeanVolume(stderr.String())
+}
+
+// parseMeanVolume extracts the mean volume in dB from volumedetect output.
+func parseMeanVolume(output string) (float64, error) {
+	match := reMeanVolume.FindStringSubmatch(output)
+	if len(match) < 2 {
+		return 0, ErrParseVolume
+	}
+	if match[1] == "-inf" {
+		return math.Inf(-1), nil
+	}
+	volume, err := strconv.ParseFloat(match[1], 64)
+	if err != nil {
+		return 0, fmt.Errorf("%w: %w", ErrParseVolume, err)
+	}
+	return volume, nil
+}
+
 // ListChunks lists all chunk files in a directory sorted by name.
 func ListChunks(dir string) ([]string, error) {
 	entries, err := os.ReadDir(dir)
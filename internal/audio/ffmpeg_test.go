@@ -2,11 +2,15 @@ package audio
 
 import (
 	"context"
+	"errors"
 	"fmt"
+	"math"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"runtime"
 	"strconv"
+	"strings"
 	"testing"
 	"time"
 )
@@ -267,6 +271,53 @@ func TestFFmpegSplitter_NonExistentFile(t *testing.T) {
 	}
 }
 
+func TestFFmpegSplitter_extractChunks_Errors(t *testing.T) {
+	segments := make([][2]float64, 2*runtime.NumCPU()+1)
+	for i := range segments {
+		segments[i] = [2]float64{float64(i), float64(i + 1)}
+	}
+
+	cancelled, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	// An ffmpeg that writes its output file and then fails
+	failingFFmpeg := filepath.Join(t.TempDir(), "ffmpeg")
+	script := "#!/bin/sh\nfor last; do :; done\n: > \"$last\"\nexit 1\n"
+	if err := os.WriteFile(failingFFmpeg, []byte(script), 0755); err != nil { // #nosec G306 - test script must be executable
+		t.Fatalf("failed to write fake ffmpeg: %v", err)
+	}
+
+	tests := []struct {
+		name       string
+		ffmpegPath string
+		ctx        context.Context
+	}{
+		{"ffmpeg not found", "/nonexistent/ffmpeg", context.Background()},
+		{"ffmpeg fails after writing output", failingFFmpeg, context.Background()},
+		{"context cancelled", "/nonexistent/ffmpeg", cancelled},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			outputDir := t.TempDir()
+			splitter := NewFFmpegSplitter(tt.ffmpegPath)
+
+			chunks, err := splitter.extractChunks(tt.ctx, "input.wav", outputDir, segments)
+			if err == nil {
+				t.Fatal("expected error")
+			}
+			if chunks != nil {
+				t.Errorf("expected no chunks, got %d", len(chunks))
+			}
+
+			leftover, _ := filepath.Glob(filepath.Join(outputDir, "chunk_*.wav"))
+			if len(leftover) != 0 {
+				t.Errorf("expected no chunk files left behind, got %v", leftover)
+			}
+		})
+	}
+}
+
 func TestDefaultSplitOpts(t *testing.T) {
 	opts := DefaultSplitOpts()
 
@@ -281,7 +332,7 @@ func TestDefaultSplitOpts(t *testing.T) {
 	}
 }
 
-func TestParseSilenceOutput(t *testing.T) {
+func TestScanAnalysisOutput_SilencesOnly(t *testing.T) {
 	// Sample ffmpeg silencedetect output
 	output := `
 [silencedetect @ 0x55f1a2b3c4d0] silence_start: 10.5
@@ -290,9 +341,9 @@ func TestParseSilenceOutput(t *testing.T) {
 [silencedetect @ 0x55f1a2b3c4d0] silence_end: 46.5 | silence_duration: 1.5
 `
 
-	intervals, err := parseSilenceOutput(output)
+	_, intervals, _, err := scanAnalysisOutput(strings.NewReader(output))
 	if err != nil {
-		t.Fatalf("parseSilenceOutput failed: %v", err)
+		t.Fatalf("scanAnalysisOutput failed: %v", err)
 	}
 
 	if len(intervals) != 2 {
@@ -312,6 +363,164 @@ func TestParseSilenceOutput(t *testing.T) {
 	}
 }
 
+func TestScanAnalysisOutput(t *testing.T) {
+	// Sample ffmpeg stderr for a single silencedetect pass with -nostats
+	output := `Input #0, wav, from 'input.wav':
+  Duration: 00:01:30.50, bitrate: 256 kb/s
+  Stream #0:0: Audio: pcm_s16le, 16000 Hz, mono, s16, 256 kb/s
+[silencedetect @ 0x55f1a2b3c4d0] silence_start: 44.1
+[silencedetect @ 0x55f1a2b3c4d0] silence_end: 45.3 | silence_duration: 1.2
+`
+
+	duration, intervals, lastLine, err := scanAnalysisOutput(strings.NewReader(output))
+	if err != nil {
+		t.Fatalf("scanAnalysisOutput failed: %v", err)
+	}
+
+	if duration != 90.5 {
+		t.Errorf("duration: got %f, want 90.5", duration)
+	}
+	if len(intervals) != 1 {
+		t.Fatalf("expected 1 interval, got %d", len(intervals))
+	}
+	if intervals[0].Start != 44.1 || intervals[0].End != 45.3 {
+		t.Errorf("interval 0: got start=%f end=%f, want start=44.1 end=45.3",
+			intervals[0].Start, intervals[0].End)
+	}
+	if !strings.Contains(lastLine, "silence_end") {
+		t.Errorf("lastLine: got %q, want silence_end line", lastLine)
+	}
+}
+
+func TestScanAnalysisOutput_NoDuration(t *testing.T) {
+	output := "input.wav: Invalid data found when processing input\n"
+
+	duration, intervals, lastLine, err := scanAnalysisOutput(strings.NewReader(output))
+	if err != nil {
+		t.Fatalf("scanAnalysisOutput failed: %v", err)
+	}
+	if duration != 0 {
+		t.Errorf("duration: got %f, want 0", duration)
+	}
+	if len(intervals) != 0 {
+		t.Errorf("expected no intervals, got %d", len(intervals))
+	}
+	if lastLine != "input.wav: Invalid data found when processing input" {
+		t.Errorf("lastLine: got %q", lastLine)
+	}
+}
+
+func TestParseMeanVolume(t *testing.T) {
+	output := `[Parsed_volumedetect_0 @ 0x5581] n_samples: 720000
+[Parsed_volumedetect_0 @ 0x5581] mean_volume: -52.3 dB
+[Parsed_volumedetect_0 @ 0x5581] max_volume: -31.0 dB`
+
+	volume, err := parseMeanVolume(output)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if volume != -52.3 {
+		t.Errorf("expected -52.3, got %f", volume)
+	}
+
+	volume, err = parseMeanVolume("[Parsed_volumedetect_0 @ 0x5581] mean_volume: -inf dB")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if !math.IsInf(volume, -1) {
+		t.Errorf("expected -inf, got %f", volume)
+	}
+
+	if _, err := parseMeanVolume("no volume here"); !errors.Is(err, ErrParseVolume) {
+		t.Errorf("expected ErrParseVolume, got %v", err)
+	}
+}
+
+func TestMeanVolume_Silence(t *testing.T) {
+	checkFFmpeg(t)
+
+	inputPath := filepath.Join(t.TempDir(), "silence.wav")
+	cmd := exec.Command("ffmpeg", "-y",
+		"-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono",
+		"-t", "2",
+		inputPath,
+	)
+	if output, err := cmd.CombinedOutput(); err != nil {
+		t.Fatalf("failed to create silent WAV: %v\n%s", err, output)
+	}
+
+	splitter := NewFFmpegSplitter("")
+	volume, err := splitter.MeanVolume(context.Background(), inputPath)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if volume > -80 {
+		t.Errorf("expected silence below -80 dB, got %f", volume)
+	}
+}
+
+func TestFindBestSilence(t *testing.T) {
+	silences := []SilenceInterval{
+		{Start: 10, End: 11},
+		{Start: 30, End: 31},
+		{Start: 44, End: 45},
+		{Start: 47, End: 48},
+		{Start: 90, End: 91},
+	}
+
+	tests := []struct {
+		name       string
+		idealPoint float64
+		tolerance  float64
+		wantStart  float64
+		wantNil    bool
+	}{
+		{"closest before ideal", 45, 15, 44, false},
+		{"closest after ideal", 47.4, 15, 47, false},
+		{"first silence", 10, 5, 10, false},
+		{"last silence", 92, 5, 90, false},
+		{"nothing within tolerance", 65, 10, 0, true},
+		{"past all silences", 200, 15, 0, true},
+	}
+
+	midpoints := silenceMidpoints(silences)
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, found := findBestSilence(midpoints, tt.idealPoint, tt.tolerance)
+			if tt.wantNil {
+				if found {
+					t.Fatalf("expected no silence, got midpoint %f", got)
+				}
+				return
+			}
+			if !found {
+				t.Fatal("expected a silence, got none")
+			}
+			if want := tt.wantStart + 0.5; got != want {
+				t.Errorf("got midpoint=%f, want %f", got, want)
+			}
+		})
+	}
+}
+
+func TestBuildSegments(t *testing.T) {
+	segments := buildSegments([]float64{40.5, 85}, 120)
+
+	expected := [][2]float64{{0, 40.5}, {40.5, 85}, {85, 120}}
+	if len(segments) != len(expected) {
+		t.Fatalf("expected %d segments, got %d", len(expected), len(segments))
+	}
+	for i := range expected {
+		if segments[i] != expected[i] {
+			t.Errorf("segment %d: got %v, want %v", i, segments[i], expected[i])
+		}
+	}
+
+	if single := buildSegments(nil, 30); len(single) != 1 || single[0] != [2]float64{0, 30} {
+		t.Errorf("expected a single full-length segment, got %v", single)
+	}
+}
+
 func TestListChunks(t *testing.T) {
 	tmpDir := t.TempDir()
 
@@ -43,3 +43,10 @@ type Splitter interface {
 	// unless a temporary directory is configured.
 	Split(ctx context.Context, inputWav, outputDir string, opts SplitOpts) ([]string, error)
 }
+
+// VolumeAnalyzer is optionally implemented by splitters that can measure the
+// loudness of an audio file, e.g. to detect chunks that are pure silence.
+type VolumeAnalyzer interface {
+	// MeanVolume returns the mean volume of the audio file in dBFS.
+	MeanVolume(ctx context.Context, inputPath string) (float64, error)
+}
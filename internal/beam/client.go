@@ -88,6 +88,16 @@ func WithBaseBackoff(d time.Duration) ClientOption {
 	}
 }
 
+// newTransport returns an HTTP transport that keeps enough idle connections
+// per host for concurrent chunk submissions and polls to reuse them, instead
+// of the default two, which forces new TLS handshakes under parallel load.
+func newTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 32
+	t.MaxIdleConnsPerHost = 16
+	return t
+}
+
 // NewClient creates a new Beam HTTP client.
 // The token can be set via the WithToken option. If not provided,
 // it is read from the environment variable BEAM_TOKEN.
@@ -99,7 +109,7 @@ func NewClient(queueURL string, opts ...ClientOption) (*HTTPClient, error) {
 
 	c := &HTTPClient{
 		queueURL:    queueURL,
-		httpClient:  &http.Client{Timeout: 30 * time.Second},
+		httpClient:  &http.Client{Timeout: 30 * time.Second, Transport: newTransport()},
 		maxRetries:  3,
 		baseBackoff: 1 * time.Second,
 	}
@@ -122,12 +132,20 @@ func NewClient(queueURL string, opts ...ClientOption) (*HTTPClient, error) {
 }
 
 // Submit sends a lip-sync task to Beam and returns the task ID.
+// If opts.ImageURL is set, the task fetches the image from that URL and
+// imageB64 is not sent.
 func (c *HTTPClient) Submit(ctx context.Context, imageB64, audioB64 string, opts SubmitOptions) (string, error) {
+	// Prefer the image URL over the inline base64 image
+	if opts.ImageURL != "" {
+		imageB64 = ""
+	}
+
 	reqBody := taskRequest{
 		Prompt:       opts.Prompt,
 		Width:        opts.Width,
 		Height:       opts.Height,
 		ImageBase64:  imageB64,
+		ImageURL:     opts.ImageURL,
 		WavBase64:    audioB64,
 		ForceOffload: &opts.ForceOffload,
 	}
@@ -269,7 +287,7 @@ func (c *HTTPClient) doRequestWithRetry(ctx context.Context, method, url string,
 		}
 
 		// Check if error is retryable
-		if !isRetryable(err) {
+		if !IsRetryable(err) {
 			return err
 		}
 
@@ -341,8 +359,9 @@ func (e *retryableError) Unwrap() error {
 	return e.err
 }
 
-// isRetryable returns true if the error should be retried.
-func isRetryable(err error) bool {
+// IsRetryable reports whether err is a transient failure (network error,
+// rate limiting or 5xx) that the client retried or would retry.
+func IsRetryable(err error) bool {
 	var re *retryableError
 	return errors.As(err, &re)
 }
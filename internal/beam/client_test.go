@@ -80,6 +80,29 @@ func TestHTTPClient_Submit(t *testing.T) {
 	assert.Equal(t, "task-123", taskID)
 }
 
+func TestHTTPClient_Submit_ImageURL(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var req taskRequest
+		err := json.NewDecoder(r.Body).Decode(&req)
+		require.NoError(t, err)
+
+		assert.Equal(t, "https://bucket.s3.amazonaws.com/images/job.png", req.ImageURL)
+		assert.Empty(t, req.ImageBase64)
+
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(taskResponse{TaskID: "task-123", Status: "PENDING"})
+	}))
+	defer server.Close()
+
+	client, err := NewClient(server.URL, WithToken("test-token"))
+	require.NoError(t, err)
+
+	_, err = client.Submit(context.Background(), "test-image", "test-audio", SubmitOptions{
+		ImageURL: "https://bucket.s3.amazonaws.com/images/job.png",
+	})
+	require.NoError(t, err)
+}
+
 func TestHTTPClient_Submit_Error(t *testing.T) {
 	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
 		w.WriteHeader(http.StatusBadRequest)
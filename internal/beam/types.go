@@ -31,6 +31,7 @@ type SubmitOptions struct {
 	Width        int    // Video width in pixels
 	Height       int    // Video height in pixels
 	ForceOffload bool   // Whether to force offload
+	ImageURL     string // URL of the source image; when set it is sent instead of image_base64 (the worker must support image_url)
 }
 
 // DefaultSubmitOptions returns the default options for submitting a task.
@@ -91,6 +91,11 @@ func NewDependencies(cfg *config.Config, logger *slog.Logger) (*Dependencies, er
 		store,
 		logger,
 		job.WithSplitOpts(splitOpts),
+		job.WithMaxConcurrentChunks(cfg.MaxConcurrentChunks),
+		job.WithChunkMaxAttempts(cfg.ChunkMaxAttempts),
+		job.WithSkipSilentChunks(cfg.SkipSilentChunks),
+		job.WithImageUpload(cfg.S3Enabled() && cfg.S3UploadImage),
+		job.WithResizeCacheDir(cfg.ResizeCacheDir),
 	)
 
 	return &Dependencies{
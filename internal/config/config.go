@@ -36,16 +36,21 @@ type Config struct {
 	BeamPollTimeoutSec int    `env:"BEAM_POLL_TIMEOUT_SEC, default=600" json:"beam_poll_timeout_sec"`  // Default 10min
 
 	// Storage settings
-	TempDir string `env:"TEMP_DIR, default=/tmp/infinitetalk" json:"temp_dir"`
+	TempDir        string `env:"TEMP_DIR, default=/tmp/infinitetalk" json:"temp_dir"`
+	ResizeCacheDir string `env:"RESIZE_CACHE_DIR" json:"resize_cache_dir,omitempty"` // Disabled when empty
 
 	// Processing settings
-	ChunkTargetSec int `env:"CHUNK_TARGET_SEC, default=45" json:"chunk_target_sec"`
+	ChunkTargetSec      int  `env:"CHUNK_TARGET_SEC, default=45" json:"chunk_target_sec"`
+	MaxConcurrentChunks int  `env:"MAX_CONCURRENT_CHUNKS, default=3" json:"max_concurrent_chunks"`
+	ChunkMaxAttempts    int  `env:"CHUNK_MAX_ATTEMPTS, default=3" json:"chunk_max_attempts"`
+	SkipSilentChunks    bool `env:"SKIP_SILENT_CHUNKS, default=false" json:"skip_silent_chunks"` // Render silent chunks locally
 
 	// Optional S3 settings
 	S3Bucket           string `env:"S3_BUCKET" json:"s3_bucket,omitempty"`
 	S3Region           string `env:"S3_REGION" json:"s3_region,omitempty"`
-	AWSAccessKeyID     string `env:"AWS_ACCESS_KEY_ID" json:"-"`     // Masked in JSON
-	AWSSecretAccessKey string `env:"AWS_SECRET_ACCESS_KEY" json:"-"` // Masked in JSON
+	AWSAccessKeyID     string `env:"AWS_ACCESS_KEY_ID" json:"-"`                            // Masked in JSON
+	AWSSecretAccessKey string `env:"AWS_SECRET_ACCESS_KEY" json:"-"`                        // Masked in JSON
+	S3UploadImage      bool   `env:"S3_UPLOAD_IMAGE, default=false" json:"s3_upload_image"` // Send image URL instead of base64; worker must read image_url
 
 	// Logging settings
 	LogFormat string `env:"LOG_FORMAT, default=text" json:"log_format"` // "json" or "text"
@@ -115,12 +120,14 @@ func (c *Config) NewLogger() *slog.Logger {
 // String returns a string representation of the config with sensitive values masked.
 func (c *Config) String() string {
 	return fmt.Sprintf(
-		"Config{Port: %d, RunPodEndpointID: %s, BeamQueueURL: %s, TempDir: %s, ChunkTargetSec: %d, S3Bucket: %s, S3Region: %s, LogFormat: %s, LogLevel: %s}",
+		"Config{Port: %d, RunPodEndpointID: %s, BeamQueueURL: %s, TempDir: %s, ChunkTargetSec: %d, MaxConcurrentChunks: %d, ChunkMaxAttempts: %d, S3Bucket: %s, S3Region: %s, LogFormat: %s, LogLevel: %s}",
 		c.Port,
 		c.RunPodEndpointID,
 		c.BeamQueueURL,
 		c.TempDir,
 		c.ChunkTargetSec,
+		c.MaxConcurrentChunks,
+		c.ChunkMaxAttempts,
 		c.S3Bucket,
 		c.S3Region,
 		c.LogFormat,
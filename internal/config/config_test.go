@@ -18,6 +18,8 @@ func TestLoad_RequiredVariables(t *testing.T) {
 		os.Unsetenv("RUNPOD_ENDPOINT_ID")
 		os.Unsetenv("TEMP_DIR")
 		os.Unsetenv("CHUNK_TARGET_SEC")
+		os.Unsetenv("MAX_CONCURRENT_CHUNKS")
+		os.Unsetenv("CHUNK_MAX_ATTEMPTS")
 		os.Unsetenv("S3_BUCKET")
 		os.Unsetenv("S3_REGION")
 		os.Unsetenv("AWS_ACCESS_KEY_ID")
@@ -66,6 +68,11 @@ func TestLoad_Defaults(t *testing.T) {
 	assert.Equal(t, 8080, cfg.Port)
 	assert.Equal(t, "/tmp/infinitetalk", cfg.TempDir)
 	assert.Equal(t, 45, cfg.ChunkTargetSec)
+	assert.Equal(t, 3, cfg.MaxConcurrentChunks)
+	assert.Equal(t, 3, cfg.ChunkMaxAttempts)
+	assert.False(t, cfg.SkipSilentChunks)
+	assert.False(t, cfg.S3UploadImage)
+	assert.Empty(t, cfg.ResizeCacheDir)
 	assert.Equal(t, "text", cfg.LogFormat)
 	assert.Equal(t, "info", cfg.LogLevel)
 }
@@ -75,11 +82,16 @@ func TestLoad_CustomValues(t *testing.T) {
 	t.Setenv("RUNPOD_ENDPOINT_ID", "custom-endpoint")
 	t.Setenv("PORT", "3000")
 	t.Setenv("TEMP_DIR", "/custom/temp")
+	t.Setenv("RESIZE_CACHE_DIR", "/custom/cache")
 	t.Setenv("CHUNK_TARGET_SEC", "60")
+	t.Setenv("MAX_CONCURRENT_CHUNKS", "5")
+	t.Setenv("CHUNK_MAX_ATTEMPTS", "2")
+	t.Setenv("SKIP_SILENT_CHUNKS", "true")
 	t.Setenv("S3_BUCKET", "my-bucket")
 	t.Setenv("S3_REGION", "us-east-1")
 	t.Setenv("AWS_ACCESS_KEY_ID", "access-key")
 	t.Setenv("AWS_SECRET_ACCESS_KEY", "secret-key")
+	t.Setenv("S3_UPLOAD_IMAGE", "true")
 	t.Setenv("LOG_FORMAT", "json")
 	t.Setenv("LOG_LEVEL", "debug")
 
@@ -88,11 +100,16 @@ func TestLoad_CustomValues(t *testing.T) {
 
 	assert.Equal(t, 3000, cfg.Port)
 	assert.Equal(t, "/custom/temp", cfg.TempDir)
+	assert.Equal(t, "/custom/cache", cfg.ResizeCacheDir)
 	assert.Equal(t, 60, cfg.ChunkTargetSec)
+	assert.Equal(t, 5, cfg.MaxConcurrentChunks)
+	assert.Equal(t, 2, cfg.ChunkMaxAttempts)
+	assert.True(t, cfg.SkipSilentChunks)
 	assert.Equal(t, "my-bucket", cfg.S3Bucket)
 	assert.Equal(t, "us-east-1", cfg.S3Region)
 	assert.Equal(t, "access-key", cfg.AWSAccessKeyID)
 	assert.Equal(t, "secret-key", cfg.AWSSecretAccessKey)
+	assert.True(t, cfg.S3UploadImage)
 	assert.Equal(t, "json", cfg.LogFormat)
 	assert.Equal(t, "debug", cfg.LogLevel)
 }
@@ -24,6 +24,7 @@ func (a *BeamAdapter) Submit(ctx context.Context, imageB64, audioB64 string, opt
 		Width:        opts.Width,
 		Height:       opts.Height,
 		ForceOffload: opts.ForceOffload,
+		ImageURL:     opts.ImageURL,
 	}
 	taskID, err := a.client.Submit(ctx, imageB64, audioB64, beamOpts)
 	if err != nil {
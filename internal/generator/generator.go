@@ -34,6 +34,7 @@ type SubmitOptions struct {
 	Width        int    // Video width in pixels
 	Height       int    // Video height in pixels
 	ForceOffload bool   // Whether to force offload (supported by both Beam and RunPod)
+	ImageURL     string // URL of the source image; when set it is sent instead of the base64 image
 }
 
 // PollResult contains the result of polling a job's status.
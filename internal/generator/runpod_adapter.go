@@ -24,6 +24,7 @@ func (a *RunPodAdapter) Submit(ctx context.Context, imageB64, audioB64 string, o
 		Width:        opts.Width,
 		Height:       opts.Height,
 		ForceOffload: opts.ForceOffload,
+		ImageURL:     opts.ImageURL,
 	}
 	jobID, err := a.client.Submit(ctx, imageB64, audioB64, runpodOpts)
 	if err != nil {
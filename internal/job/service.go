@@ -5,12 +5,17 @@ package job
 import (
 	"bytes"
 	"context"
+	"crypto/sha256"
 	"encoding/base64"
+	"encoding/hex"
 	"errors"
 	"fmt"
+	"io"
 	"log/slog"
 	"os"
 	"path/filepath"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/maauso/infinitetalk-api/internal/audio"
@@ -43,6 +48,17 @@ var (
 	ErrProviderJobTimedOut = errors.New("provider job timed out")
 )
 
+const (
+	// maxChunkRetryBackoff caps the delay between chunk retries.
+	maxChunkRetryBackoff = 30 * time.Second
+	// silentChunkThresholdDB is the mean volume below which a chunk is
+	// considered silent and rendered locally instead of by the provider.
+	silentChunkThresholdDB = -50.0
+	// imageURLExpiry is how long the presigned URL of an uploaded job image
+	// stays valid; it must outlast the job's chunk processing.
+	imageURLExpiry = 24 * time.Hour
+)
+
 // ProcessVideoInput contains the input parameters for video processing.
 type ProcessVideoInput struct {
 	// ImageBase64 is the base64-encoded source image.
@@ -92,8 +108,28 @@ type ProcessVideoService struct {
 	logger     *slog.Logger
 	// splitOpts configures audio splitting behavior.
 	splitOpts audio.SplitOpts
-	// pollInterval is the duration between RunPod status polls.
+	// pollInterval is the delay before the first provider status poll.
+	// Subsequent delays grow exponentially up to maxPollInterval.
 	pollInterval time.Duration
+	// maxPollInterval caps the delay between provider status polls.
+	maxPollInterval time.Duration
+	// maxConcurrentChunks limits how many chunks are processed in parallel.
+	maxConcurrentChunks int
+	// chunkMaxAttempts is how many times a failed chunk is attempted before
+	// the job fails.
+	chunkMaxAttempts int
+	// chunkRetryBackoff is the delay before the first chunk retry; it doubles
+	// on each further retry up to maxChunkRetryBackoff.
+	chunkRetryBackoff time.Duration
+	// uploadImage uploads the resized image to S3 once per job and sends its
+	// URL to the provider instead of the base64 image with every chunk.
+	uploadImage bool
+	// skipSilentChunks renders silent chunks locally as a still image instead
+	// of sending them to the provider.
+	skipSilentChunks bool
+	// resizeCacheDir stores resized images across jobs, keyed by image content
+	// and target size. Caching is disabled when empty.
+	resizeCacheDir string
 }
 
 // ServiceOption is a function that configures a ProcessVideoService.
@@ -106,7 +142,7 @@ func WithSplitOpts(opts audio.SplitOpts) ServiceOption {
 	}
 }
 
-// WithPollInterval sets the polling interval for RunPod status checks.
+// WithPollInterval sets the initial polling interval for provider status checks.
 func WithPollInterval(d time.Duration) ServiceOption {
 	return func(s *ProcessVideoService) {
 		if d > 0 {
@@ -115,6 +151,72 @@ func WithPollInterval(d time.Duration) ServiceOption {
 	}
 }
 
+// WithMaxPollInterval sets the maximum polling interval reached by backoff.
+func WithMaxPollInterval(d time.Duration) ServiceOption {
+	return func(s *ProcessVideoService) {
+		if d > 0 {
+			s.maxPollInterval = d
+		}
+	}
+}
+
+// WithMaxConcurrentChunks sets the maximum number of chunks processed in parallel.
+func WithMaxConcurrentChunks(n int) ServiceOption {
+	return func(s *ProcessVideoService) {
+		if n > 0 {
+			s.maxConcurrentChunks = n
+		}
+	}
+}
+
+// WithChunkMaxAttempts sets how many times a chunk is attempted before the job
+// fails. Only transient failures are retried, spaced with exponential backoff.
+func WithChunkMaxAttempts(n int) ServiceOption {
+	return func(s *ProcessVideoService) {
+		if n > 0 {
+			s.chunkMaxAttempts = n
+		}
+	}
+}
+
+// WithChunkRetryBackoff sets the delay before the first chunk retry.
+func WithChunkRetryBackoff(d time.Duration) ServiceOption {
+	return func(s *ProcessVideoService) {
+		if d > 0 {
+			s.chunkRetryBackoff = d
+		}
+	}
+}
+
+// WithImageUpload enables uploading the resized source image to S3 once per job.
+// Providers then receive a presigned URL instead of the base64-encoded image in
+// every chunk request, and the object is deleted when the job finishes. If the
+// upload fails, the base64 image is used. The provider's worker must accept
+// image_url; workers that only read image_base64 fail every chunk.
+func WithImageUpload(enabled bool) ServiceOption {
+	return func(s *ProcessVideoService) {
+		s.uploadImage = enabled
+	}
+}
+
+// WithSkipSilentChunks enables rendering chunks whose audio is silent locally
+// as a still-image video, skipping the provider. It requires a splitter that
+// implements audio.VolumeAnalyzer and a processor that implements
+// media.StillVideoRenderer; otherwise all chunks go to the provider.
+func WithSkipSilentChunks(enabled bool) ServiceOption {
+	return func(s *ProcessVideoService) {
+		s.skipSilentChunks = enabled
+	}
+}
+
+// WithResizeCacheDir enables caching resized images (and their base64
+// encoding) in dir, so repeated jobs with the same image skip the resize.
+func WithResizeCacheDir(dir string) ServiceOption {
+	return func(s *ProcessVideoService) {
+		s.resizeCacheDir = dir
+	}
+}
+
 // NewProcessVideoService creates a new ProcessVideoService with all dependencies.
 func NewProcessVideoService(
 	repo Repository,
@@ -130,15 +232,19 @@ func NewProcessVideoService(
 		logger = slog.Default()
 	}
 	s := &ProcessVideoService{
-		repo:         repo,
-		processor:    processor,
-		splitter:     splitter,
-		runpod:       runpodClient,
-		beamClient:   beamClient,
-		storage:      storageClient,
-		logger:       logger,
-		splitOpts:    audio.DefaultSplitOpts(),
-		pollInterval: 5 * time.Second,
+		repo:                repo,
+		processor:           processor,
+		splitter:            splitter,
+		runpod:              runpodClient,
+		beamClient:          beamClient,
+		storage:             storageClient,
+		logger:              logger,
+		splitOpts:           audio.DefaultSplitOpts(),
+		pollInterval:        time.Second,
+		maxPollInterval:     30 * time.Second,
+		maxConcurrentChunks: 3,
+		chunkMaxAttempts:    1,
+		chunkRetryBackoff:   time.Second,
 	}
 	for _, opt := range opts {
 		opt(s)
@@ -324,51 +430,42 @@ func (s *ProcessVideoService) processJob(ctx context.Context, job *Job, input Pr
 		slog.String("audio_path", audioPath),
 	)
 
-	// Step 3: Resize image with padding
-	// Image is always resized to 1024x1024 (optimal resolution for lip-sync model)
-	// The input.Width and input.Height are used only for output video dimensions
-	const imageResizeWidth = 1024
-	const imageResizeHeight = 1024
-	resizedImagePath := filepath.Join(filepath.Dir(imagePath), fmt.Sprintf("resized_%s.png", job.ID))
-	if err := s.processor.ResizeImageWithPadding(ctx, imagePath, resizedImagePath, imageResizeWidth, imageResizeHeight); err != nil {
-		s.logger.Error("failed to resize image",
-			slog.String("job_id", job.ID),
-			slog.String("error", err.Error()),
-		)
-		return s.failJob(ctx, job, fmt.Sprintf("failed to resize image: %v", err))
-	}
-	tempFiles = append(tempFiles, resizedImagePath)
-
-	// Read resized image as base64
-	resizedImageB64, err := s.fileToBase64(resizedImagePath)
-	if err != nil {
-		s.logger.Error("failed to encode resized image",
-			slog.String("job_id", job.ID),
-			slog.String("error", err.Error()),
-		)
-		return s.failJob(ctx, job, fmt.Sprintf("failed to encode resized image: %v", err))
-	}
-
-	s.logger.Info("image resized",
-		slog.String("job_id", job.ID),
-		slog.Int("image_width", imageResizeWidth),
-		slog.Int("image_height", imageResizeHeight),
-		slog.Int("video_width", input.Width),
-		slog.Int("video_height", input.Height),
-	)
+	// Step 3: Prepare the image while the audio is split. The two pipelines are
+	// independent, so the resize runs in the background and is collected once
+	// the split (usually the slower of the two) has finished.
+	imageCtx, cancelImage := context.WithCancel(ctx)
+	defer cancelImage()
+	imageDone := make(chan preparedImage, 1)
+	go func() {
+		imageDone <- s.prepareImage(imageCtx, job.ID, input, imagePath)
+	}()
 
 	// Step 4: Split audio into chunks
 	outputDir := filepath.Dir(audioPath)
-	audioChunks, err := s.splitter.Split(ctx, audioPath, outputDir, s.splitOpts)
-	if err != nil {
+	audioChunks, splitErr := s.splitter.Split(ctx, audioPath, outputDir, s.splitOpts)
+	if splitErr != nil {
+		cancelImage()
+	}
+	image := <-imageDone
+	tempFiles = append(tempFiles, image.tempFiles...)
+	if image.url != "" {
+		// The image is only needed while chunks are processed
+		defer s.deleteUploadedImage(context.Background(), job.ID) //nolint:contextcheck // Cleanup must run after ctx is cancelled
+	}
+
+	if splitErr != nil {
 		s.logger.Error("failed to split audio",
 			slog.String("job_id", job.ID),
-			slog.String("error", err.Error()),
+			slog.String("error", splitErr.Error()),
 		)
-		return s.failJob(ctx, job, fmt.Sprintf("failed to split audio: %v", err))
+		return s.failJob(ctx, job, fmt.Sprintf("failed to split audio: %v", splitErr))
 	}
 	tempFiles = append(tempFiles, audioChunks...)
 
+	if image.err != nil {
+		return s.failJob(ctx, job, image.err.Error())
+	}
+
 	s.logger.Info("audio split into chunks",
 		slog.String("job_id", job.ID),
 		slog.Int("chunk_count", len(audioChunks)),
@@ -409,8 +506,16 @@ func (s *ProcessVideoService) processJob(ctx context.Context, job *Job, input Pr
 		}, nil
 	}
 
-	// Step 5: Process chunks sequentially with frame continuity
-	videoPaths, err := s.processChunksSequential(ctx, job, gen, resizedImageB64, audioChunks, input.Width, input.Height, input.ForceOffload)
+	// Step 5: Process chunks in parallel
+	submitOpts := generator.SubmitOptions{
+		Prompt:       job.Prompt,
+		Width:        input.Width,
+		Height:       input.Height,
+		ForceOffload: input.ForceOffload,
+		ImageURL:     image.url,
+	}
+	videoPaths, err := s.processChunksParallel(ctx, job, gen, image.b64, audioChunks, submitOpts)
+	tempFiles = append(tempFiles, videoPaths...)
 	if err != nil {
 		s.logger.Error("failed to process chunks",
 			slog.String("job_id", job.ID),
@@ -418,7 +523,6 @@ func (s *ProcessVideoService) processJob(ctx context.Context, job *Job, input Pr
 		)
 		return s.failJob(ctx, job, err.Error())
 	}
-	tempFiles = append(tempFiles, videoPaths...)
 
 	s.logger.Info("all chunks processed",
 		slog.String("job_id", job.ID),
@@ -499,58 +603,220 @@ func (s *ProcessVideoService) processJob(ctx context.Context, job *Job, input Pr
 	}, nil
 }
 
-// processChunksSequential processes audio chunks one by one, using the same
-// source image for all chunks to maintain visual consistency and avoid
-// cumulative visual drift.
-func (s *ProcessVideoService) processChunksSequential(
+// processChunksParallel processes audio chunks concurrently, keeping at most
+// maxConcurrentChunks provider jobs in flight. Every chunk uses the same source
+// image, so chunks are independent and visual consistency is preserved.
+//
+// The returned video paths are ordered by chunk index. The first failing chunk
+// cancels the remaining ones; in that case the videos that were already
+// produced are still returned alongside the error so they can be cleaned up.
+func (s *ProcessVideoService) processChunksParallel(
 	ctx context.Context,
 	job *Job,
 	gen generator.Generator,
 	initialImageB64 string,
 	audioChunks []string,
-	width, height int,
-	forceOffload bool,
+	submitOpts generator.SubmitOptions,
 ) ([]string, error) {
-	videoPaths := make([]string, 0, len(audioChunks))
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	var (
+		wg        sync.WaitGroup
+		mu        sync.Mutex
+		firstErr  error
+		completed int
+	)
+	results := make([]string, len(audioChunks))
+	sem := make(chan struct{}, s.maxConcurrentChunks)
 
 	for i, chunkPath := range audioChunks {
-		// Check context before starting each chunk
+		// Wait for a free slot or stop launching chunks once cancelled
 		select {
+		case sem <- struct{}{}:
 		case <-ctx.Done():
-			return nil, fmt.Errorf("context cancelled: %w", ctx.Err())
-		default:
+		}
+		if ctx.Err() != nil {
+			break
 		}
 
-		s.logger.Info("processing chunk sequentially",
+		s.logger.Info("processing chunk in parallel",
 			slog.String("job_id", job.ID),
 			slog.Int("chunk_index", i),
 			slog.Int("total_chunks", len(audioChunks)),
 		)
 
-		// Process this chunk with the original image
-		videoPath, err := s.processChunkWithGenerator(
-			ctx, job, gen, i, initialImageB64, chunkPath, width, height, forceOffload,
-		)
-
-		if err != nil {
-			return nil, fmt.Errorf("chunk %d failed: %w", i, err)
-		}
-		videoPaths = append(videoPaths, videoPath)
+		wg.Add(1)
+		go func(i int, chunkPath string) {
+			defer wg.Done()
+			defer func() { <-sem }()
 
-		// Update progress
-		progress := ((i + 1) * 90) / len(audioChunks) // Reserve 10% for joining
-		job.UpdateProgress(progress)
-		if err := s.repo.Save(ctx, job); err != nil {
-			s.logger.Warn("failed to save job progress",
-				slog.String("job_id", job.ID),
-				slog.String("error", err.Error()),
+			// Process this chunk with the original image
+			videoPath, err := s.processChunkWithRetry(
+				ctx, job, gen, i, initialImageB64, chunkPath, submitOpts,
 			)
+
+			mu.Lock()
+			defer mu.Unlock()
+
+			if err != nil {
+				if firstErr == nil {
+					firstErr = fmt.Errorf("chunk %d failed: %w", i, err)
+					cancel()
+				}
+				return
+			}
+			results[i] = videoPath
+
+			// Update progress
+			completed++
+			progress := (completed * 90) / len(audioChunks) // Reserve 10% for joining
+			job.UpdateProgress(progress)
+			if err := s.repo.Save(ctx, job); err != nil {
+				s.logger.Warn("failed to save job progress",
+					slog.String("job_id", job.ID),
+					slog.String("error", err.Error()),
+				)
+			}
+		}(i, chunkPath)
+	}
+
+	wg.Wait()
+
+	videoPaths := make([]string, 0, len(results))
+	for _, p := range results {
+		if p != "" {
+			videoPaths = append(videoPaths, p)
 		}
 	}
 
+	if firstErr != nil {
+		return videoPaths, firstErr
+	}
+	if err := ctx.Err(); err != nil {
+		return videoPaths, fmt.Errorf("context cancelled: %w", err)
+	}
+
 	return videoPaths, nil
 }
 
+// transientChunkError marks a chunk failure that a new attempt may fix, such
+// as a provider outage or a timed-out provider job.
+type transientChunkError struct {
+	err error
+}
+
+func (e *transientChunkError) Error() string {
+	return e.err.Error()
+}
+
+func (e *transientChunkError) Unwrap() error {
+	return e.err
+}
+
+// isTransientChunkError returns true if the chunk failure should be retried.
+func isTransientChunkError(err error) bool {
+	var te *transientChunkError
+	return errors.As(err, &te)
+}
+
+// processChunkWithRetry processes a chunk, retrying transient failures with
+// exponential backoff until chunkMaxAttempts is reached or ctx is cancelled.
+// Deterministic failures (rejected submissions, failed or cancelled provider
+// jobs, local I/O errors) are returned immediately.
+func (s *ProcessVideoService) processChunkWithRetry(
+	ctx context.Context,
+	job *Job,
+	gen generator.Generator,
+	idx int,
+	imageB64, audioPath string,
+	submitOpts generator.SubmitOptions,
+) (string, error) {
+	if videoPath, ok := s.renderSilentChunk(ctx, job, idx, audioPath, submitOpts); ok {
+		return videoPath, nil
+	}
+
+	backoff := s.chunkRetryBackoff
+	for attempt := 1; ; attempt++ {
+		videoPath, err := s.processChunkWithGenerator(ctx, job, gen, idx, imageB64, audioPath, submitOpts)
+		if err == nil || !isTransientChunkError(err) || attempt >= s.chunkMaxAttempts || ctx.Err() != nil {
+			return videoPath, err
+		}
+
+		s.logger.Warn("chunk failed, retrying",
+			slog.String("job_id", job.ID),
+			slog.Int("chunk_index", idx),
+			slog.Int("attempt", attempt),
+			slog.Int("max_attempts", s.chunkMaxAttempts),
+			slog.Duration("backoff", backoff),
+			slog.String("error", err.Error()),
+		)
+
+		select {
+		case <-ctx.Done():
+			return "", err
+		case <-time.After(backoff):
+		}
+		backoff = min(backoff*2, maxChunkRetryBackoff)
+	}
+}
+
+// renderSilentChunk renders a still-image video locally for a chunk whose
+// audio is silent, saving a provider invocation. It reports false when
+// skipping is disabled or unsupported, the chunk is not silent, or rendering
+// fails; the chunk is then sent to the provider as usual.
+func (s *ProcessVideoService) renderSilentChunk(
+	ctx context.Context,
+	job *Job,
+	idx int,
+	audioPath string,
+	submitOpts generator.SubmitOptions,
+) (string, bool) {
+	if !s.skipSilentChunks || job.InputImagePath == "" {
+		return "", false
+	}
+	analyzer, ok := s.splitter.(audio.VolumeAnalyzer)
+	if !ok {
+		return "", false
+	}
+	renderer, ok := s.processor.(media.StillVideoRenderer)
+	if !ok {
+		return "", false
+	}
+
+	volume, err := analyzer.MeanVolume(ctx, audioPath)
+	if err != nil {
+		s.logger.Warn("failed to measure chunk volume",
+			slog.String("job_id", job.ID),
+			slog.Int("chunk_index", idx),
+			slog.String("error", err.Error()),
+		)
+		return "", false
+	}
+	if volume >= silentChunkThresholdDB {
+		return "", false
+	}
+
+	videoPath := filepath.Join(filepath.Dir(audioPath), fmt.Sprintf("chunk_%s_%d.mp4", job.ID, idx))
+	if err := renderer.RenderStillVideo(ctx, job.InputImagePath, audioPath, videoPath, submitOpts.Width, submitOpts.Height); err != nil {
+		s.logger.Warn("failed to render silent chunk locally",
+			slog.String("job_id", job.ID),
+			slog.Int("chunk_index", idx),
+			slog.String("error", err.Error()),
+		)
+		_ = os.Remove(videoPath)
+		return "", false
+	}
+
+	s.completeChunk(job, idx, videoPath)
+	s.logger.Info("silent chunk rendered locally",
+		slog.String("job_id", job.ID),
+		slog.Int("chunk_index", idx),
+		slog.Float64("mean_volume_db", volume),
+	)
+	return videoPath, true
+}
+
 // processChunkWithGenerator processes a single audio chunk using a generator interface.
 func (s *ProcessVideoService) processChunkWithGenerator(
 	ctx context.Context,
@@ -558,8 +824,7 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 	gen generator.Generator,
 	idx int,
 	imageB64, audioPath string,
-	width, height int,
-	forceOffload bool,
+	submitOpts generator.SubmitOptions,
 ) (string, error) {
 	// Update chunk status to processing
 	s.updateChunkStatus(job, idx, ChunkStatusProcessing, "")
@@ -568,7 +833,7 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 		slog.String("job_id", job.ID),
 		slog.String("provider", string(job.Provider)),
 		slog.Int("chunk_index", idx),
-		slog.Bool("force_offload", forceOffload),
+		slog.Bool("force_offload", submitOpts.ForceOffload),
 	)
 
 	// Read audio as base64
@@ -579,16 +844,16 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 	}
 
 	// Submit using generator interface
-	submitOpts := generator.SubmitOptions{
-		Prompt:       job.Prompt,
-		Width:        width,
-		Height:       height,
-		ForceOffload: forceOffload,
-	}
 	providerJobID, err := gen.Submit(ctx, imageB64, audioB64, submitOpts)
 	if err != nil {
 		s.updateChunkStatus(job, idx, ChunkStatusFailed, err.Error())
-		return "", fmt.Errorf("failed to submit to provider: %w", err)
+		err = fmt.Errorf("failed to submit to provider: %w", err)
+		// Only outages and rate limiting are worth a new submission; 4xx
+		// rejections would fail again
+		if runpod.IsRetryable(err) || beam.IsRetryable(err) {
+			return "", &transientChunkError{err: err}
+		}
+		return "", err
 	}
 
 	// Update chunk with provider job ID
@@ -610,21 +875,21 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 	pollResult, err := s.pollForResultWithGenerator(ctx, gen, job.ID, idx, providerJobID)
 	if err != nil {
 		s.updateChunkStatus(job, idx, ChunkStatusFailed, err.Error())
-		return "", fmt.Errorf("failed to poll provider: %w", err)
+		err = fmt.Errorf("failed to poll provider: %w", err)
+		if errors.Is(err, ErrProviderJobTimedOut) {
+			return "", &transientChunkError{err: err}
+		}
+		return "", err
 	}
 
 	// Handle video output differently based on provider
 	var videoPath string
 	switch {
 	case pollResult.VideoBase64 != "":
-		// RunPod path: decode base64 to file
-		videoData, err := base64.StdEncoding.DecodeString(pollResult.VideoBase64)
-		if err != nil {
-			s.updateChunkStatus(job, idx, ChunkStatusFailed, err.Error())
-			return "", fmt.Errorf("failed to decode video: %w", err)
-		}
+		// RunPod path: decode base64 while writing, without materializing the video
 		videoFileName := fmt.Sprintf("chunk_%s_%d.mp4", job.ID, idx)
-		videoPath, err = s.storage.SaveTemp(ctx, videoFileName, bytes.NewReader(videoData))
+		videoData := base64.NewDecoder(base64.StdEncoding, strings.NewReader(pollResult.VideoBase64))
+		videoPath, err = s.storage.SaveTemp(ctx, videoFileName, videoData)
 		if err != nil {
 			s.updateChunkStatus(job, idx, ChunkStatusFailed, err.Error())
 			return "", fmt.Errorf("failed to save video: %w", err)
@@ -634,7 +899,7 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 		videoPath = filepath.Join(filepath.Dir(audioPath), fmt.Sprintf("chunk_%s_%d.mp4", job.ID, idx))
 		if err := gen.DownloadOutput(ctx, pollResult.VideoURL, videoPath); err != nil {
 			s.updateChunkStatus(job, idx, ChunkStatusFailed, err.Error())
-			return "", fmt.Errorf("failed to download video: %w", err)
+			return "", &transientChunkError{err: fmt.Errorf("failed to download video: %w", err)}
 		}
 	default:
 		s.updateChunkStatus(job, idx, ChunkStatusFailed, ErrNoVideoOutput.Error())
@@ -642,13 +907,7 @@ func (s *ProcessVideoService) processChunkWithGenerator(
 	}
 
 	// Update chunk status to completed
-	job.mu.Lock()
-	if idx < len(job.Chunks) {
-		job.Chunks[idx].Status = ChunkStatusCompleted
-		job.Chunks[idx].OutputPath = videoPath
-		job.Chunks[idx].CompletedAt = time.Now()
-	}
-	job.mu.Unlock()
+	s.completeChunk(job, idx, videoPath)
 
 	s.logger.Info("chunk processing completed",
 		slog.String("job_id", job.ID),
@@ -667,8 +926,11 @@ func (s *ProcessVideoService) pollForResultWithGenerator(
 	chunkIdx int,
 	providerJobID string,
 ) (generator.PollResult, error) {
-	ticker := time.NewTicker(s.pollInterval)
-	defer ticker.Stop()
+	// Poll with exponential backoff: chunks take minutes to render, so the
+	// delay grows by 1.5x per poll up to maxPollInterval.
+	delay := s.pollInterval
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
 
 	var (
 		attempt    int
@@ -680,7 +942,12 @@ func (s *ProcessVideoService) pollForResultWithGenerator(
 		select {
 		case <-ctx.Done():
 			return generator.PollResult{}, fmt.Errorf("context cancelled: %w", ctx.Err())
-		case <-ticker.C:
+		case <-timer.C:
+			if delay < s.maxPollInterval {
+				delay = min(delay*3/2, s.maxPollInterval)
+			}
+			timer.Reset(delay)
+
 			attempt++
 			pollResult, err := gen.Poll(ctx, providerJobID)
 			if err != nil {
@@ -760,6 +1027,17 @@ func (s *ProcessVideoService) pollForResultWithGenerator(
 	}
 }
 
+// completeChunk marks a chunk as completed with its output video.
+func (s *ProcessVideoService) completeChunk(job *Job, idx int, videoPath string) {
+	job.mu.Lock()
+	defer job.mu.Unlock()
+	if idx >= 0 && idx < len(job.Chunks) {
+		job.Chunks[idx].Status = ChunkStatusCompleted
+		job.Chunks[idx].OutputPath = videoPath
+		job.Chunks[idx].CompletedAt = time.Now()
+	}
+}
+
 // updateChunkStatus updates the status of a chunk in the job.
 func (s *ProcessVideoService) updateChunkStatus(job *Job, idx int, status ChunkStatus, errMsg string) {
 	job.mu.Lock()
@@ -792,12 +1070,235 @@ func (s *ProcessVideoService) saveBase64ToTemp(ctx context.Context, b64Data, fil
 }
 
 // fileToBase64 reads a file and returns its base64-encoded content.
+// The file is streamed through the encoder into a buffer sized for the
+// encoded output, so the raw bytes are never held in memory in full.
 func (s *ProcessVideoService) fileToBase64(path string) (string, error) {
-	data, err := os.ReadFile(path) // #nosec G304 - path is constructed internally
+	f, err := os.Open(path) // #nosec G304 - path is constructed internally
 	if err != nil {
 		return "", fmt.Errorf("read file: %w", err)
 	}
-	return base64.StdEncoding.EncodeToString(data), nil
+	defer func() { _ = f.Close() }()
+
+	info, err := f.Stat()
+	if err != nil {
+		return "", fmt.Errorf("read file: %w", err)
+	}
+
+	var sb strings.Builder
+	sb.Grow(base64.StdEncoding.EncodedLen(int(info.Size())))
+	enc := base64.NewEncoder(base64.StdEncoding, &sb)
+	if _, err := io.Copy(enc, f); err != nil {
+		return "", fmt.Errorf("read file: %w", err)
+	}
+	if err := enc.Close(); err != nil {
+		return "", fmt.Errorf("encode file: %w", err)
+	}
+	return sb.String(), nil
+}
+
+// preparedImage is the resized input image in the form chunks are submitted
+// with: inline base64, or a URL when the image was uploaded to S3.
+type preparedImage struct {
+	b64       string
+	url       string
+	tempFiles []string
+	err       error
+}
+
+// prepareImage resizes the input image, optionally uploads it to S3 and
+// encodes it as base64 when the provider cannot fetch it by URL.
+func (s *ProcessVideoService) prepareImage(ctx context.Context, jobID string, input ProcessVideoInput, imagePath string) preparedImage {
+	// Image is always resized to 1024x1024 (optimal resolution for lip-sync model)
+	// The input.Width and input.Height are used only for output video dimensions
+	const imageResizeWidth = 1024
+	const imageResizeHeight = 1024
+
+	var result preparedImage
+	resizedImagePath, cached, err := s.resizeImage(ctx, jobID, input.ImageBase64, imagePath, imageResizeWidth, imageResizeHeight)
+	if err != nil {
+		s.logger.Error("failed to resize image",
+			slog.String("job_id", jobID),
+			slog.String("error", err.Error()),
+		)
+		result.err = fmt.Errorf("failed to resize image: %w", err)
+		return result
+	}
+	if !cached {
+		result.tempFiles = append(result.tempFiles, resizedImagePath)
+	}
+
+	// Upload the resized image once so chunks can reference it by URL
+	if s.uploadImage {
+		result.url, err = s.uploadImageToS3(ctx, jobID, resizedImagePath)
+		if err != nil {
+			s.logger.Warn("failed to upload image to S3, sending base64 instead",
+				slog.String("job_id", jobID),
+				slog.String("error", err.Error()),
+			)
+		}
+	}
+
+	// Read resized image as base64 unless the provider fetches it by URL
+	if result.url == "" {
+		result.b64, err = s.encodeResizedImage(resizedImagePath, cached)
+		if err != nil {
+			s.logger.Error("failed to encode resized image",
+				slog.String("job_id", jobID),
+				slog.String("error", err.Error()),
+			)
+			result.err = fmt.Errorf("failed to encode resized image: %w", err)
+			return result
+		}
+	}
+
+	s.logger.Info("image resized",
+		slog.String("job_id", jobID),
+		slog.Int("image_width", imageResizeWidth),
+		slog.Int("image_height", imageResizeHeight),
+		slog.Int("video_width", input.Width),
+		slog.Int("video_height", input.Height),
+	)
+
+	return result
+}
+
+// resizeImage resizes the job's input image with padding. When a resize cache
+// is configured, the result is looked up in and stored to the cache, keyed by
+// the image content and target size; cached reports whether the returned path
+// belongs to the cache (and so must not be cleaned up with the job).
+func (s *ProcessVideoService) resizeImage(ctx context.Context, jobID, imageB64, imagePath string, w, h int) (path string, cached bool, err error) {
+	jobPath := filepath.Join(filepath.Dir(imagePath), fmt.Sprintf("resized_%s.png", jobID))
+	if s.resizeCacheDir == "" {
+		if err := s.processor.ResizeImageWithPadding(ctx, imagePath, jobPath, w, h); err != nil {
+			return "", false, fmt.Errorf("resize image: %w", err)
+		}
+		return jobPath, false, nil
+	}
+
+	hasher := sha256.New()
+	_, _ = io.WriteString(hasher, imageB64)
+	_, _ = fmt.Fprintf(hasher, "|%dx%d", w, h)
+	key := hex.EncodeToString(hasher.Sum(nil)[:8])
+	cachePath := filepath.Join(s.resizeCacheDir, fmt.Sprintf("resized_%s.png", key))
+	if _, err := os.Stat(cachePath); err == nil {
+		s.logger.Debug("using cached resized image",
+			slog.String("job_id", jobID),
+			slog.String("path", cachePath),
+		)
+		return cachePath, true, nil
+	}
+
+	// Resize into a temp file inside the cache dir so the final rename never
+	// crosses filesystems; fall back to the job copy if the cache is unusable
+	tmpPath, err := s.createCacheTemp()
+	if err != nil {
+		s.logger.Warn("failed to cache resized image",
+			slog.String("job_id", jobID),
+			slog.String("error", err.Error()),
+		)
+		if err := s.processor.ResizeImageWithPadding(ctx, imagePath, jobPath, w, h); err != nil {
+			return "", false, fmt.Errorf("resize image: %w", err)
+		}
+		return jobPath, false, nil
+	}
+
+	if err := s.processor.ResizeImageWithPadding(ctx, imagePath, tmpPath, w, h); err != nil {
+		_ = os.Remove(tmpPath)
+		return "", false, fmt.Errorf("resize image: %w", err)
+	}
+
+	if err := os.Rename(tmpPath, cachePath); err != nil {
+		s.logger.Warn("failed to cache resized image",
+			slog.String("job_id", jobID),
+			slog.String("error", err.Error()),
+		)
+		// The temp file is still a valid resize result; clean it up with the job
+		return tmpPath, false, nil
+	}
+	return cachePath, true, nil
+}
+
+// createCacheTemp creates an empty PNG temp file in the resize cache dir and
+// returns its path.
+func (s *ProcessVideoService) createCacheTemp() (string, error) {
+	if err := os.MkdirAll(s.resizeCacheDir, 0750); err != nil {
+		return "", fmt.Errorf("create cache dir: %w", err)
+	}
+	f, err := os.CreateTemp(s.resizeCacheDir, "resized-*.png")
+	if err != nil {
+		return "", fmt.Errorf("create cache temp file: %w", err)
+	}
+	if err := f.Close(); err != nil {
+		_ = os.Remove(f.Name())
+		return "", fmt.Errorf("close cache temp file: %w", err)
+	}
+	return f.Name(), nil
+}
+
+// encodeResizedImage returns the base64 encoding of the resized image. For
+// cached images the encoding is cached alongside as a .b64 file.
+func (s *ProcessVideoService) encodeResizedImage(path string, cached bool) (string, error) {
+	if !cached {
+		return s.fileToBase64(path)
+	}
+
+	b64Path := strings.TrimSuffix(path, filepath.Ext(path)) + ".b64"
+	if data, err := os.ReadFile(b64Path); err == nil { // #nosec G304 - path is constructed internally
+		return string(data), nil
+	}
+
+	b64, err := s.fileToBase64(path)
+	if err != nil {
+		return "", err
+	}
+
+	// Best-effort: write to a temp file and rename so readers never see a partial file
+	if f, err := os.CreateTemp(filepath.Dir(b64Path), "resized-*.tmp"); err == nil {
+		_, werr := f.WriteString(b64)
+		cerr := f.Close()
+		if werr != nil || cerr != nil || os.Rename(f.Name(), b64Path) != nil {
+			_ = os.Remove(f.Name())
+		}
+	}
+	return b64, nil
+}
+
+// imageS3Key returns the S3 key under which a job's resized image is uploaded.
+func imageS3Key(jobID string) string {
+	return fmt.Sprintf("images/%s.png", jobID)
+}
+
+// uploadImageToS3 uploads the resized image for a job and returns a presigned
+// URL the provider can fetch it from without bucket credentials.
+func (s *ProcessVideoService) uploadImageToS3(ctx context.Context, jobID, path string) (string, error) {
+	imageFile, err := os.Open(path) // #nosec G304 - path is constructed internally
+	if err != nil {
+		return "", fmt.Errorf("open image: %w", err)
+	}
+	defer func() { _ = imageFile.Close() }()
+
+	key := imageS3Key(jobID)
+	if _, err := s.storage.UploadToS3(ctx, key, imageFile); err != nil {
+		return "", fmt.Errorf("upload image: %w", err)
+	}
+
+	url, err := s.storage.PresignS3URL(ctx, key, imageURLExpiry)
+	if err != nil {
+		s.deleteUploadedImage(ctx, jobID)
+		return "", fmt.Errorf("presign image URL: %w", err)
+	}
+	return url, nil
+}
+
+// deleteUploadedImage removes a job's uploaded image from S3. Failures are
+// only logged since the job result does not depend on it.
+func (s *ProcessVideoService) deleteUploadedImage(ctx context.Context, jobID string) {
+	if err := s.storage.DeleteFromS3(ctx, imageS3Key(jobID)); err != nil {
+		s.logger.Warn("failed to delete uploaded image from S3",
+			slog.String("job_id", jobID),
+			slog.String("error", err.Error()),
+		)
+	}
 }
 
 // failJob marks the job as failed and returns the appropriate output.
@@ -8,7 +8,12 @@ import (
 	"fmt"
 	"io"
 	"log/slog"
+	"net/http"
+	"net/http/httptest"
 	"os"
+	"path/filepath"
+	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -91,6 +96,16 @@ func (m *mockStorage) UploadToS3(ctx context.Context, key string, data io.Reader
 	return args.String(0), args.Error(1)
 }
 
+func (m *mockStorage) PresignS3URL(ctx context.Context, key string, expires time.Duration) (string, error) {
+	args := m.Called(ctx, key, expires)
+	return args.String(0), args.Error(1)
+}
+
+func (m *mockStorage) DeleteFromS3(ctx context.Context, key string) error {
+	args := m.Called(ctx, key)
+	return args.Error(0)
+}
+
 // Helper function to create a test service with all mocks
 func newTestService(t *testing.T) (*ProcessVideoService, *mockProcessor, *mockSplitter, *mockRunpodClient, *mockStorage, Repository) {
 	repo := NewMemoryRepository()
@@ -141,6 +156,7 @@ func TestNewProcessVideoService_WithOptions(t *testing.T) {
 	svc := NewProcessVideoService(repo, processor, splitter, runpodClient, nil, storageClient, nil,
 		WithSplitOpts(audio.SplitOpts{ChunkTargetSec: 30}),
 		WithPollInterval(10*time.Second),
+		WithMaxPollInterval(time.Minute),
 	)
 
 	if svc.splitOpts.ChunkTargetSec != 30 {
@@ -149,6 +165,9 @@ func TestNewProcessVideoService_WithOptions(t *testing.T) {
 	if svc.pollInterval != 10*time.Second {
 		t.Errorf("expected pollInterval 10s, got %v", svc.pollInterval)
 	}
+	if svc.maxPollInterval != time.Minute {
+		t.Errorf("expected maxPollInterval 1m, got %v", svc.maxPollInterval)
+	}
 }
 
 func TestProcessVideoService_CreateJob(t *testing.T) {
@@ -341,7 +360,7 @@ func TestProcessVideoService_Process_SaveImageFails(t *testing.T) {
 }
 
 func TestProcessVideoService_Process_ResizeImageFails(t *testing.T) {
-	svc, processor, _, _, storageClient, _ := newTestService(t)
+	svc, processor, splitter, _, storageClient, _ := newTestService(t)
 	ctx := context.Background()
 
 	input := ProcessVideoInput{
@@ -358,6 +377,10 @@ func TestProcessVideoService_Process_ResizeImageFails(t *testing.T) {
 	processor.On("ResizeImageWithPadding", mock.Anything, "/tmp/image.png", mock.Anything, 1024, 1024).
 		Return(errors.New("resize error")).Once()
 
+	// Audio is split concurrently with the resize, so its chunks must still be cleaned up
+	splitter.On("Split", mock.Anything, "/tmp/audio.wav", "/tmp", mock.Anything).
+		Return([]string{"/tmp/chunk_000.wav"}, nil).Once()
+
 	output, err := svc.Process(ctx, input)
 	if err != nil {
 		t.Fatalf("Process should not return error, got: %v", err)
@@ -366,12 +389,14 @@ func TestProcessVideoService_Process_ResizeImageFails(t *testing.T) {
 	if output.Status != StatusFailed {
 		t.Errorf("expected status FAILED, got %s", output.Status)
 	}
-	if output.Error == "" {
-		t.Error("expected error message")
+	if !strings.Contains(output.Error, "failed to resize image") {
+		t.Errorf("expected resize error, got %q", output.Error)
 	}
 
 	processor.AssertExpectations(t)
+	splitter.AssertExpectations(t)
 	storageClient.AssertExpectations(t)
+	storageClient.AssertCalled(t, "CleanupTemp", mock.Anything, []string{"/tmp/image.png", "/tmp/audio.wav", "/tmp/chunk_000.wav"})
 }
 
 func TestProcessVideoService_Process_SplitAudioFails(t *testing.T) {
@@ -655,6 +680,86 @@ func TestProcessVideoService_Process_WithS3Upload(t *testing.T) {
 	os.Remove("/tmp/image.png")
 }
 
+func TestProcessVideoService_Process_WithImageUpload(t *testing.T) {
+	repo := NewMemoryRepository()
+	processor := &mockProcessor{}
+	splitter := &mockSplitter{}
+	runpodClient := &mockRunpodClient{}
+	storageClient := &mockStorage{}
+	logger := slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{Level: slog.LevelError}))
+	svc := NewProcessVideoService(repo, processor, splitter, runpodClient, nil, storageClient, logger,
+		WithPollInterval(10*time.Millisecond),
+		WithImageUpload(true),
+	)
+	ctx := context.Background()
+
+	tempDir := t.TempDir()
+	imagePath := filepath.Join(tempDir, "image.png")
+	chunkPath := filepath.Join(tempDir, "chunk_0.wav")
+	imageData := []byte("test-image-data")
+	audioData := []byte("test-audio-data")
+	videoData := []byte("test-video-data")
+	input := ProcessVideoInput{
+		ImageBase64: base64.StdEncoding.EncodeToString(imageData),
+		AudioBase64: base64.StdEncoding.EncodeToString(audioData),
+		Width:       384,
+		Height:      576,
+	}
+	imageURL := "https://s3.example.com/images/job.png?X-Amz-Signature=abc"
+
+	storageClient.On("SaveTemp", mock.Anything, "image.png", mock.Anything).Return(imagePath, nil).Once()
+	storageClient.On("SaveTemp", mock.Anything, "audio.wav", mock.Anything).Return(filepath.Join(tempDir, "audio.wav"), nil).Once()
+	storageClient.On("SaveTemp", mock.Anything, mock.MatchedBy(func(s string) bool {
+		return strings.HasPrefix(s, "chunk_")
+	}), mock.Anything).Return(filepath.Join(tempDir, "chunk_0.mp4"), nil).Once()
+	storageClient.On("UploadToS3", mock.Anything, mock.MatchedBy(func(s string) bool {
+		return strings.HasPrefix(s, "images/")
+	}), mock.Anything).Return("https://s3.example.com/images/job.png", nil).Once()
+	// The provider gets a presigned URL, and the object is removed after the job
+	storageClient.On("PresignS3URL", mock.Anything, mock.MatchedBy(func(s string) bool {
+		return strings.HasPrefix(s, "images/")
+	}), imageURLExpiry).Return(imageURL, nil).Once()
+	storageClient.On("DeleteFromS3", mock.Anything, mock.MatchedBy(func(s string) bool {
+		return strings.HasPrefix(s, "images/")
+	})).Return(nil).Once()
+	storageClient.On("CleanupTemp", mock.Anything, mock.Anything).Return(nil)
+
+	processor.On("ResizeImageWithPadding", mock.Anything, imagePath, mock.Anything, mock.Anything, mock.Anything).
+		Run(func(args mock.Arguments) {
+			_ = os.WriteFile(args.Get(2).(string), imageData, 0644)
+		}).
+		Return(nil).Once()
+	processor.On("JoinVideos", mock.Anything, mock.Anything, mock.Anything).
+		Run(func(args mock.Arguments) {
+			_ = os.WriteFile(args.Get(2).(string), videoData, 0644)
+		}).
+		Return(nil).Once()
+
+	splitter.On("Split", mock.Anything, mock.Anything, tempDir, mock.Anything).
+		Return([]string{chunkPath}, nil).Once()
+	_ = os.WriteFile(chunkPath, audioData, 0644)
+
+	// The image is referenced by URL, so no base64 image is submitted
+	runpodClient.On("Submit", mock.Anything, "", mock.Anything, mock.MatchedBy(func(opts runpod.SubmitOptions) bool {
+		return opts.ImageURL == imageURL
+	})).Return("runpod-job-123", nil).Once()
+	runpodClient.On("Poll", mock.Anything, "runpod-job-123").
+		Return(runpod.PollResult{Status: runpod.StatusCompleted, VideoBase64: base64.StdEncoding.EncodeToString(videoData)}, nil).Once()
+
+	output, err := svc.Process(ctx, input)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if output.Status != StatusCompleted {
+		t.Errorf("expected status COMPLETED, got %s", output.Status)
+	}
+
+	processor.AssertExpectations(t)
+	splitter.AssertExpectations(t)
+	runpodClient.AssertExpectations(t)
+	storageClient.AssertExpectations(t)
+}
+
 func TestProcessVideoService_Process_MultipleChunks(t *testing.T) {
 	svc, processor, splitter, runpodClient, storageClient, repo := newTestService(t)
 	ctx := context.Background()
@@ -839,6 +944,356 @@ func TestProcessVideoService_pollForResultWithGenerator_PollingWithRetry(t *test
 	runpodClient.AssertExpectations(t)
 }
 
+// fakeGenerator is a generator.Generator that completes every job on the
+// first poll and records how many jobs were in flight at the same time.
+type fakeGenerator struct {
+	mu          sync.Mutex
+	submitted   int
+	inFlight    int
+	maxInFlight int
+	// failSubmits is the number of initial Submit calls that fail.
+	failSubmits int
+	// submitErr is returned by failing Submit calls (default: a generic error).
+	submitErr error
+}
+
+func (g *fakeGenerator) Submit(_ context.Context, _, _ string, _ generator.SubmitOptions) (string, error) {
+	g.mu.Lock()
+	defer g.mu.Unlock()
+	g.submitted++
+	if g.submitted <= g.failSubmits {
+		if g.submitErr != nil {
+			return "", g.submitErr
+		}
+		return "", errors.New("submit error")
+	}
+	g.inFlight++
+	if g.inFlight > g.maxInFlight {
+		g.maxInFlight = g.inFlight
+	}
+	return fmt.Sprintf("provider-job-%d", g.submitted), nil
+}
+
+func (g *fakeGenerator) Poll(_ context.Context, jobID string) (generator.PollResult, error) {
+	// Keep the job in flight long enough for the others to overlap
+	time.Sleep(20 * time.Millisecond)
+	g.mu.Lock()
+	defer g.mu.Unlock()
+	g.inFlight--
+	return generator.PollResult{Status: generator.StatusCompleted, VideoURL: "https://example.com/" + jobID}, nil
+}
+
+func (g *fakeGenerator) DownloadOutput(_ context.Context, _, _ string) error {
+	return nil
+}
+
+func TestProcessVideoService_pollForResultWithGenerator_Backoff(t *testing.T) {
+	repo := NewMemoryRepository()
+	runpodClient := &mockRunpodClient{}
+	svc := NewProcessVideoService(repo, &mockProcessor{}, &mockSplitter{}, runpodClient, nil, &mockStorage{}, nil,
+		WithPollInterval(10*time.Millisecond),
+		WithMaxPollInterval(20*time.Millisecond),
+	)
+	gen := generator.NewRunPodAdapter(runpodClient)
+
+	runpodClient.On("Poll", mock.Anything, "job-123").
+		Return(runpod.PollResult{Status: runpod.StatusRunning}, nil).Times(4)
+	runpodClient.On("Poll", mock.Anything, "job-123").
+		Return(runpod.PollResult{Status: runpod.StatusCompleted}, nil).Once()
+
+	start := time.Now()
+	_, err := svc.pollForResultWithGenerator(context.Background(), gen, "test-job", 0, "job-123")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	// Delays are 10ms, 15ms, then capped at 20ms: 10+15+20+20+20
+	if elapsed := time.Since(start); elapsed < 85*time.Millisecond {
+		t.Errorf("expected polls to back off, finished after %v", elapsed)
+	}
+	runpodClient.AssertExpectations(t)
+}
+
+func TestProcessVideoService_processChunksParallel_RespectsLimit(t *testing.T) {
+	repo := NewMemoryRepository()
+	logger := slog.New(slog.NewTextHandler(os.Stderr, &slog.HandlerOptions{Level: slog.LevelError}))
+	svc := NewProcessVideoService(repo, &mockProcessor{}, &mockSplitter{}, &mockRunpodClient{}, nil, &mockStorage{}, logger,
+		WithPollInterval(time.Millisecond),
+		WithMaxConcurrentChunks(2),
+	)
+	ctx := context.Background()
+
+	dir := t.TempDir()
+	audioChunks := make([]string, 5)
+	chunks := make([]Chunk, len(audioChunks))
+	for i := range audioChunks {
+		audioChunks[i] = filepath.Join(dir, fmt.Sprintf("chunk_%d.wav", i))
+		if err := os.WriteFile(audioChunks[i], []byte("audio"), 0644); err != nil {
+			t.Fatalf("failed to create chunk file: %v", err)
+		}
+		chunks[i] = Chunk{Index: i, Status: ChunkStatusPending, InputPath: audioChunks[i]}
+	}
+
+	job := New()
+	job.SetChunks(chunks)
+
+	gen := &fakeGenerator{}
+	videoPaths, err := svc.processChunksParallel(ctx, job, gen, "image-b64", audioChunks, generator.SubmitOptions{Width: 384, Height: 576})
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if gen.maxInFlight > 2 {
+		t.Errorf("expected at most 2 chunks in flight, got %d", gen.maxInFlight)
+	}
+	if gen.maxInFlight < 2 {
+		t.Errorf("expected chunks to overlap, max in flight was %d", gen.maxInFlight)
+	}
+
+	// Results must be ordered by chunk index regardless of completion order
+	if len(videoPaths) != len(audioChunks) {
+		t.Fatalf("expected %d video paths, got %d", len(audioChunks), len(videoPaths))
+	}
+	for i, p := range videoPaths {
+		if !strings.HasSuffix(p, fmt.Sprintf("_%d.mp4", i)) {
+			t.Errorf("video path %d out of order: %s", i, p)
+		}
+	}
+	if job.Progress != 90 {
+		t.Errorf("expected progress 90, got %d", job.Progress)
+	}
+}
+
+// runpodSubmitError returns the error a real RunPod client reports when the
+// server answers /run with the given status code.
+func runpodSubmitError(t *testing.T, status int) error {
+	t.Helper()
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.WriteHeader(status)
+	}))
+	t.Cleanup(srv.Close)
+
+	client, err := runpod.NewClient("endpoint", runpod.WithAPIKey("key"), runpod.WithBaseURL(srv.URL), runpod.WithMaxRetries(0))
+	if err != nil {
+		t.Fatalf("failed to create client: %v", err)
+	}
+	_, err = client.Submit(context.Background(), "aW1n", "d2F2", runpod.SubmitOptions{})
+	if err == nil {
+		t.Fatal("expected submit error")
+	}
+	return err
+}
+
+func TestProcessVideoService_processChunkWithRetry(t *testing.T) {
+	serverErr := runpodSubmitError(t, http.StatusServiceUnavailable)
+	badRequestErr := runpodSubmitError(t, http.StatusBadRequest)
+
+	tests := []struct {
+		name        string
+		maxAttempts int
+		failSubmits int
+		submitErr   error
+		wantSubmits int
+		wantErr     bool
+		wantStatus  ChunkStatus
+	}{
+		{"succeeds after retries", 3, 2, serverErr, 3, false, ChunkStatusCompleted},
+		{"fails when attempts are exhausted", 2, 2, serverErr, 2, true, ChunkStatusFailed},
+		{"does not retry rejected submissions", 3, 2, badRequestErr, 1, true, ChunkStatusFailed},
+		{"does not retry unknown errors", 3, 2, nil, 1, true, ChunkStatusFailed},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			svc := NewProcessVideoService(NewMemoryRepository(), &mockProcessor{}, &mockSplitter{}, &mockRunpodClient{}, nil, &mockStorage{}, nil,
+				WithPollInterval(time.Millisecond),
+				WithChunkMaxAttempts(tt.maxAttempts),
+				WithChunkRetryBackoff(time.Millisecond),
+			)
+
+			chunkPath := filepath.Join(t.TempDir(), "chunk_0.wav")
+			if err := os.WriteFile(chunkPath, []byte("audio"), 0644); err != nil {
+				t.Fatalf("failed to create chunk file: %v", err)
+			}
+			job := New()
+			job.SetChunks([]Chunk{{Index: 0, Status: ChunkStatusPending, InputPath: chunkPath}})
+
+			gen := &fakeGenerator{failSubmits: tt.failSubmits, submitErr: tt.submitErr}
+			_, err := svc.processChunkWithRetry(context.Background(), job, gen, 0, "image-b64", chunkPath, generator.SubmitOptions{})
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("unexpected error: %v", err)
+			}
+
+			if gen.submitted != tt.wantSubmits {
+				t.Errorf("expected %d submissions, got %d", tt.wantSubmits, gen.submitted)
+			}
+			if job.Chunks[0].Status != tt.wantStatus {
+				t.Errorf("expected chunk status %s, got %s", tt.wantStatus, job.Chunks[0].Status)
+			}
+		})
+	}
+}
+
+// volumeSplitter is a mockSplitter that also implements audio.VolumeAnalyzer.
+type volumeSplitter struct {
+	*mockSplitter
+	volume float64
+}
+
+func (s *volumeSplitter) MeanVolume(_ context.Context, _ string) (float64, error) {
+	return s.volume, nil
+}
+
+// stillRenderer is a mockProcessor that also implements media.StillVideoRenderer.
+type stillRenderer struct {
+	*mockProcessor
+	rendered []string
+}
+
+func (p *stillRenderer) RenderStillVideo(_ context.Context, _, _, output string, _, _ int) error {
+	p.rendered = append(p.rendered, output)
+	return os.WriteFile(output, []byte("still-video"), 0644)
+}
+
+func TestProcessVideoService_processChunkWithRetry_SilentChunk(t *testing.T) {
+	tests := []struct {
+		name         string
+		volume       float64
+		wantRendered bool
+	}{
+		{"silent chunk is rendered locally", -91, true},
+		{"audible chunk goes to the provider", -20, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			processor := &stillRenderer{mockProcessor: &mockProcessor{}}
+			splitter := &volumeSplitter{mockSplitter: &mockSplitter{}, volume: tt.volume}
+			svc := NewProcessVideoService(NewMemoryRepository(), processor, splitter, &mockRunpodClient{}, nil, &mockStorage{}, nil,
+				WithPollInterval(time.Millisecond),
+				WithSkipSilentChunks(true),
+			)
+
+			chunkPath := filepath.Join(t.TempDir(), "chunk_0.wav")
+			if err := os.WriteFile(chunkPath, []byte("audio"), 0644); err != nil {
+				t.Fatalf("failed to create chunk file: %v", err)
+			}
+			job := New()
+			job.InputImagePath = "/tmp/image.png"
+			job.SetChunks([]Chunk{{Index: 0, Status: ChunkStatusPending, InputPath: chunkPath}})
+
+			gen := &fakeGenerator{}
+			videoPath, err := svc.processChunkWithRetry(context.Background(), job, gen, 0, "image-b64", chunkPath, generator.SubmitOptions{Width: 384, Height: 576})
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+
+			if rendered := len(processor.rendered) == 1; rendered != tt.wantRendered {
+				t.Errorf("expected rendered=%v, got %d renders", tt.wantRendered, len(processor.rendered))
+			}
+			if submitted := gen.submitted > 0; submitted == tt.wantRendered {
+				t.Errorf("expected provider submission=%v, got %d submissions", !tt.wantRendered, gen.submitted)
+			}
+			if job.Chunks[0].Status != ChunkStatusCompleted || job.Chunks[0].OutputPath != videoPath {
+				t.Errorf("expected completed chunk with output %s, got %+v", videoPath, job.Chunks[0])
+			}
+		})
+	}
+}
+
+func TestProcessVideoService_resizeImage_Cache(t *testing.T) {
+	processor := &mockProcessor{}
+	cacheDir := filepath.Join(t.TempDir(), "cache")
+	svc := NewProcessVideoService(NewMemoryRepository(), processor, &mockSplitter{}, &mockRunpodClient{}, nil, &mockStorage{}, nil,
+		WithResizeCacheDir(cacheDir),
+	)
+	ctx := context.Background()
+	tempDir := t.TempDir()
+	imagePath := filepath.Join(tempDir, "image.png")
+	resizedData := []byte("resized-image-data")
+
+	// Only the first call for the same image and size resizes
+	processor.On("ResizeImageWithPadding", mock.Anything, imagePath, mock.Anything, 1024, 1024).
+		Run(func(args mock.Arguments) {
+			_ = os.WriteFile(args.Get(2).(string), resizedData, 0644)
+		}).
+		Return(nil).Once()
+
+	first, cached, err := svc.resizeImage(ctx, "job-1", "image-b64", imagePath, 1024, 1024)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if !cached || filepath.Dir(first) != cacheDir {
+		t.Fatalf("expected resized image in cache dir, got %s (cached=%v)", first, cached)
+	}
+
+	second, cached, err := svc.resizeImage(ctx, "job-2", "image-b64", imagePath, 1024, 1024)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if !cached || second != first {
+		t.Errorf("expected cache hit at %s, got %s (cached=%v)", first, second, cached)
+	}
+
+	// The base64 encoding is cached alongside the image
+	b64, err := svc.encodeResizedImage(second, cached)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if b64 != base64.StdEncoding.EncodeToString(resizedData) {
+		t.Errorf("unexpected base64 %q", b64)
+	}
+	if _, err := os.Stat(strings.TrimSuffix(second, ".png") + ".b64"); err != nil {
+		t.Errorf("expected cached base64 file: %v", err)
+	}
+
+	processor.AssertExpectations(t)
+}
+
+func TestProcessVideoService_resizeImage_CacheOnSeparateDir(t *testing.T) {
+	// The cache may live on a different filesystem than TEMP_DIR, so the resize
+	// must be written inside the cache dir rather than moved there from the job dir
+	cacheDir := filepath.Join(t.TempDir(), "cache")
+	processor := &mockProcessor{}
+	svc := NewProcessVideoService(NewMemoryRepository(), processor, &mockSplitter{}, &mockRunpodClient{}, nil, &mockStorage{}, nil,
+		WithResizeCacheDir(cacheDir),
+	)
+	tempDir := t.TempDir()
+	imagePath := filepath.Join(tempDir, "image.png")
+
+	processor.On("ResizeImageWithPadding", mock.Anything, imagePath, mock.Anything, 1024, 1024).
+		Run(func(args mock.Arguments) {
+			dst := args.Get(2).(string)
+			if filepath.Dir(dst) != cacheDir {
+				t.Errorf("expected resize output in cache dir %s, got %s", cacheDir, dst)
+			}
+			_ = os.WriteFile(dst, []byte("resized"), 0644)
+		}).
+		Return(nil).Once()
+
+	path, cached, err := svc.resizeImage(context.Background(), "job-1", "image-b64", imagePath, 1024, 1024)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if !cached || filepath.Dir(path) != cacheDir {
+		t.Fatalf("expected cached image in %s, got %s (cached=%v)", cacheDir, path, cached)
+	}
+
+	entries, err := os.ReadDir(cacheDir)
+	if err != nil {
+		t.Fatalf("failed to read cache dir: %v", err)
+	}
+	if len(entries) != 1 {
+		t.Errorf("expected only the cached image in cache dir, got %d entries", len(entries))
+	}
+	tempEntries, _ := os.ReadDir(tempDir)
+	if len(tempEntries) != 0 {
+		t.Errorf("expected nothing written to temp dir, got %d entries", len(tempEntries))
+	}
+
+	processor.AssertExpectations(t)
+}
+
 func TestFileToBase64(t *testing.T) {
 	svc, _, _, _, _, _ := newTestService(t)
 
@@ -865,6 +1320,26 @@ func TestFileToBase64(t *testing.T) {
 	}
 }
 
+func TestFileToBase64_LargeFile(t *testing.T) {
+	svc, _, _, _, _, _ := newTestService(t)
+
+	// Larger than io.Copy's buffer and not a multiple of 3
+	content := bytes.Repeat([]byte{0x00, 0x7f, 0xff, 0x10, 0x20}, 20001)
+	tmpFile := filepath.Join(t.TempDir(), "large.bin")
+	if err := os.WriteFile(tmpFile, content, 0644); err != nil {
+		t.Fatalf("failed to create temp file: %v", err)
+	}
+
+	result, err := svc.fileToBase64(tmpFile)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if result != base64.StdEncoding.EncodeToString(content) {
+		t.Error("streamed encoding doesn't match base64.StdEncoding.EncodeToString")
+	}
+}
+
 func TestFileToBase64_NonExistentFile(t *testing.T) {
 	svc, _, _, _, _, _ := newTestService(t)
 
@@ -3,8 +3,10 @@ package media
 import (
 	"bytes"
 	"context"
+	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -23,15 +25,27 @@ var (
 type FFmpegProcessor struct {
 	// ffmpegPath is the path to the ffmpeg binary. Defaults to "ffmpeg".
 	ffmpegPath string
+	// ffprobePath is the path to the ffprobe binary. Defaults to "ffprobe".
+	ffprobePath string
 }
 
 // NewFFmpegProcessor creates a new FFmpegProcessor.
 // If ffmpegPath is empty, it defaults to "ffmpeg" (found via PATH).
+// ffprobe is looked up in PATH.
 func NewFFmpegProcessor(ffmpegPath string) *FFmpegProcessor {
+	return NewFFmpegProcessorWithProbe(ffmpegPath, "")
+}
+
+// NewFFmpegProcessorWithProbe creates a new FFmpegProcessor with custom paths.
+// Empty paths default to "ffmpeg" and "ffprobe" (found via PATH).
+func NewFFmpegProcessorWithProbe(ffmpegPath, ffprobePath string) *FFmpegProcessor {
 	if ffmpegPath == "" {
 		ffmpegPath = "ffmpeg"
 	}
-	return &FFmpegProcessor{ffmpegPath: ffmpegPath}
+	if ffprobePath == "" {
+		ffprobePath = "ffprobe"
+	}
+	return &FFmpegProcessor{ffmpegPath: ffmpegPath, ffprobePath: ffprobePath}
 }
 
 // ResizeImageWithPadding resizes an image to the specified dimensions while
@@ -42,9 +56,10 @@ func (p *FFmpegProcessor) ResizeImageWithPadding(ctx context.Context, src, dst s
 	}
 
 	// FFmpeg filter to scale with aspect ratio preservation and add black padding
-	// scale: scales to fit within w x h while maintaining aspect ratio
+	// scale: scales to fit within w x h while maintaining aspect ratio, using
+	// swscale's SIMD area-averaging kernel (sources are usually downscaled)
 	// pad: adds black padding to center the image and reach exact dimensions
-	filter := fmt.Sprintf("scale=%d:%d:force_original_aspect_ratio=decrease,pad=%d:%d:(ow-iw)/2:(oh-ih)/2:black", w, h, w, h)
+	filter := fmt.Sprintf("scale=%d:%d:force_original_aspect_ratio=decrease:flags=area,pad=%d:%d:(ow-iw)/2:(oh-ih)/2:black", w, h, w, h)
 
 	args := []string{
 		"-y",      // Overwrite output file without asking
@@ -57,9 +72,40 @@ func (p *FFmpegProcessor) ResizeImageWithPadding(ctx context.Context, src, dst s
 	return p.runFFmpeg(ctx, args)
 }
 
+// RenderStillVideo renders a still image over an audio track as an H.264/AAC
+// MP4. The image is resized with padding to w x h like ResizeImageWithPadding.
+func (p *FFmpegProcessor) RenderStillVideo(ctx context.Context, imagePath, audioPath, output string, w, h int) error {
+	if w <= 0 || h <= 0 {
+		return fmt.Errorf("%w: width=%d, height=%d", ErrInvalidDimensions, w, h)
+	}
+
+	filter := fmt.Sprintf("scale=%d:%d:force_original_aspect_ratio=decrease:flags=area,pad=%d:%d:(ow-iw)/2:(oh-ih)/2:black", w, h, w, h)
+
+	args := []string{
+		"-y",                          // Overwrite output file
+		"-loop", "1", "-i", imagePath, // Repeat the image as the video stream
+		"-i", audioPath, // Audio track
+		"-vf", filter, // Video filter
+		"-r", "25", // Frame rate
+		"-c:v", "libx264", // Video codec
+		"-tune", "stillimage", // Optimize for static content
+		"-preset", "veryfast", // Encoding speed preset
+		"-pix_fmt", "yuv420p", // Widely compatible pixel format
+		"-c:a", "aac", // Audio codec
+		"-b:a", "128k", // Audio bitrate
+		"-shortest",               // Stop when the audio ends
+		"-movflags", "+faststart", // Move moov atom to the front for streaming
+		output, // Output file
+	}
+
+	return p.runFFmpeg(ctx, args)
+}
+
 // JoinVideos concatenates multiple video files into a single output file.
-// It first attempts a fast copy (no re-encoding) and falls back to re-encoding
-// with libx264/aac if the copy fails.
+// Segments are probed first: when their stream parameters match, a fast copy
+// (no re-encoding) is attempted. Mismatched segments, or a failed copy, are
+// re-encoded with libx264/aac, since concat-copy of mismatched streams can
+// produce a broken file without failing.
 func (p *FFmpegProcessor) JoinVideos(ctx context.Context, videoPaths []string, output string) error {
 	if len(videoPaths) == 0 {
 		return ErrNoVideoPaths
@@ -70,76 +116,179 @@ func (p *FFmpegProcessor) JoinVideos(ctx context.Context, videoPaths []string, o
 		return p.copyFile(videoPaths[0], output)
 	}
 
-	// Create a temporary file list for the concat demuxer
-	listFile, err := p.createConcatList(videoPaths)
+	// Build the file list for the concat demuxer; it is fed to ffmpeg via stdin
+	list, err := buildConcatList(videoPaths)
 	if err != nil {
 		return fmt.Errorf("create concat list: %w", err)
 	}
-	defer func() { _ = os.Remove(listFile) }()
 
-	// Try fast copy first (no re-encoding)
-	err = p.joinWithCopy(ctx, listFile, output)
-	if err == nil {
-		return nil
+	// Try fast copy first (no re-encoding) unless the segments are known to differ.
+	// If probing fails, the copy is still attempted as before.
+	params, probeErr := p.probeAll(ctx, videoPaths)
+	if probeErr != nil || canConcatCopy(params) {
+		err = p.joinWithCopy(ctx, list, output)
+		if err == nil {
+			return nil
+		}
 	}
 
 	// Fast copy failed, fall back to re-encoding
-	return p.joinWithReencode(ctx, listFile, output)
+	return p.joinWithReencode(ctx, list, output)
 }
 
 // joinWithCopy attempts to concatenate videos using stream copy (no re-encoding).
-func (p *FFmpegProcessor) joinWithCopy(ctx context.Context, listFile, output string) error {
+func (p *FFmpegProcessor) joinWithCopy(ctx context.Context, list []byte, output string) error {
 	args := []string{
 		"-y",           // Overwrite output file
 		"-f", "concat", // Use concat demuxer
 		"-safe", "0", // Allow absolute paths
-		"-i", listFile, // Input file list
+		"-protocol_whitelist", "file,pipe", // Read the list from stdin, segments from disk
+		"-i", "pipe:0", // Input file list
 		"-c", "copy", // Copy streams without re-encoding
 		output, // Output file
 	}
-	return p.runFFmpeg(ctx, args)
+	return p.runFFmpegWithInput(ctx, args, bytes.NewReader(list))
 }
 
 // joinWithReencode concatenates videos by re-encoding with libx264/aac.
-func (p *FFmpegProcessor) joinWithReencode(ctx context.Context, listFile, output string) error {
+func (p *FFmpegProcessor) joinWithReencode(ctx context.Context, list []byte, output string) error {
 	args := []string{
 		"-y",           // Overwrite output file
 		"-f", "concat", // Use concat demuxer
 		"-safe", "0", // Allow absolute paths
-		"-i", listFile, // Input file list
+		"-protocol_whitelist", "file,pipe", // Read the list from stdin, segments from disk
+		"-i", "pipe:0", // Input file list
 		"-c:v", "libx264", // Video codec
-		"-preset", "fast", // Encoding speed preset
-		"-crf", "23", // Quality (lower = better, 23 is default)
+		"-preset", "veryfast", // Encoding speed preset
+		"-threads", "0", // Use all available cores
+		"-crf", "20", // Quality (lower = better, 23 is default)
 		"-c:a", "aac", // Audio codec
 		"-b:a", "128k", // Audio bitrate
+		"-movflags", "+faststart", // Move moov atom to the front for streaming
 		output, // Output file
 	}
-	return p.runFFmpeg(ctx, args)
+	return p.runFFmpegWithInput(ctx, args, bytes.NewReader(list))
 }
 
-// createConcatList creates a temporary file containing the list of video files
-// in the format required by ffmpeg's concat demuxer.
-func (p *FFmpegProcessor) createConcatList(videoPaths []string) (string, error) {
-	f, err := os.CreateTemp("", "ffmpeg-concat-*.txt")
-	if err != nil {
-		return "", fmt.Errorf("create temp file: %w", err)
+// streamParams holds the stream parameters that must match across segments
+// for the concat demuxer to stream-copy them into a valid file.
+type streamParams struct {
+	VideoCodec string
+	Profile    string
+	Width      int
+	Height     int
+	PixFmt     string
+	FrameRate  string
+	AudioCodec string
+	SampleRate string
+	Channels   int
+}
+
+// ffprobeStreams is the subset of `ffprobe -show_streams -of json` output used
+// to build streamParams.
+type ffprobeStreams struct {
+	Streams []struct {
+		CodecType  string `json:"codec_type"`
+		CodecName  string `json:"codec_name"`
+		Profile    string `json:"profile"`
+		Width      int    `json:"width"`
+		Height     int    `json:"height"`
+		PixFmt     string `json:"pix_fmt"`
+		RFrameRate string `json:"r_frame_rate"`
+		SampleRate string `json:"sample_rate"`
+		Channels   int    `json:"channels"`
+	} `json:"streams"`
+}
+
+// probeAll returns the stream parameters of each video.
+func (p *FFmpegProcessor) probeAll(ctx context.Context, videoPaths []string) ([]streamParams, error) {
+	params := make([]streamParams, 0, len(videoPaths))
+	for _, path := range videoPaths {
+		sp, err := p.probeStreams(ctx, path)
+		if err != nil {
+			return nil, fmt.Errorf("probe %s: %w", path, err)
+		}
+		params = append(params, sp)
+	}
+	return params, nil
+}
+
+// probeStreams runs ffprobe on a video and returns its first video and audio
+// stream parameters.
+func (p *FFmpegProcessor) probeStreams(ctx context.Context, path string) (streamParams, error) {
+	// #nosec G204 - ffprobePath is set by the application, not user input
+	cmd := exec.CommandContext(ctx, p.ffprobePath,
+		"-v", "error",
+		"-show_streams",
+		"-of", "json",
+		path,
+	)
+
+	var stdout, stderr bytes.Buffer
+	cmd.Stdout = &stdout
+	cmd.Stderr = &stderr
+
+	if err := cmd.Run(); err != nil {
+		return streamParams{}, fmt.Errorf("ffprobe error: %w, stderr: %s", err, stderr.String())
+	}
+
+	return parseStreamParams(stdout.Bytes())
+}
+
+// parseStreamParams extracts streamParams from ffprobe JSON output.
+func parseStreamParams(data []byte) (streamParams, error) {
+	var out ffprobeStreams
+	if err := json.Unmarshal(data, &out); err != nil {
+		return streamParams{}, fmt.Errorf("parse ffprobe output: %w", err)
 	}
-	defer func() { _ = f.Close() }()
 
+	var sp streamParams
+	var haveVideo, haveAudio bool
+	for _, st := range out.Streams {
+		switch {
+		case st.CodecType == "video" && !haveVideo:
+			haveVideo = true
+			sp.VideoCodec = st.CodecName
+			sp.Profile = st.Profile
+			sp.Width = st.Width
+			sp.Height = st.Height
+			sp.PixFmt = st.PixFmt
+			sp.FrameRate = st.RFrameRate
+		case st.CodecType == "audio" && !haveAudio:
+			haveAudio = true
+			sp.AudioCodec = st.CodecName
+			sp.SampleRate = st.SampleRate
+			sp.Channels = st.Channels
+		}
+	}
+	return sp, nil
+}
+
+// canConcatCopy reports whether all segments share the same stream parameters.
+func canConcatCopy(params []streamParams) bool {
+	for _, sp := range params[1:] {
+		if sp != params[0] {
+			return false
+		}
+	}
+	return true
+}
+
+// buildConcatList returns the list of video files in the format required by
+// ffmpeg's concat demuxer.
+func buildConcatList(videoPaths []string) ([]byte, error) {
+	var buf bytes.Buffer
 	for _, path := range videoPaths {
 		// Convert to absolute path for safety
 		absPath, err := filepath.Abs(path)
 		if err != nil {
-			return "", fmt.Errorf("get absolute path for %s: %w", path, err)
+			return nil, fmt.Errorf("get absolute path for %s: %w", path, err)
 		}
 		// Escape single quotes in path
 		escapedPath := strings.ReplaceAll(absPath, "'", "'\\''")
-		if _, err := fmt.Fprintf(f, "file '%s'\n", escapedPath); err != nil {
-			return "", fmt.Errorf("write to concat list: %w", err)
-		}
+		fmt.Fprintf(&buf, "file '%s'\n", escapedPath)
 	}
-
-	return f.Name(), nil
+	return buf.Bytes(), nil
 }
 
 // copyFile copies a file from src to dst.
@@ -157,8 +306,15 @@ func (p *FFmpegProcessor) copyFile(src, dst string) error {
 // runFFmpeg executes ffmpeg with the given arguments and returns an error
 // containing stderr output if the command fails.
 func (p *FFmpegProcessor) runFFmpeg(ctx context.Context, args []string) error {
+	return p.runFFmpegWithInput(ctx, args, nil)
+}
+
+// runFFmpegWithInput executes ffmpeg like runFFmpeg, with stdin connected to
+// the given reader (if non-nil).
+func (p *FFmpegProcessor) runFFmpegWithInput(ctx context.Context, args []string, stdin io.Reader) error {
 	// #nosec G204 - ffmpegPath is set by the application, not user input
 	cmd := exec.CommandContext(ctx, p.ffmpegPath, args...)
+	cmd.Stdin = stdin
 
 	var stderr bytes.Buffer
 	cmd.Stderr = &stderr
@@ -2,6 +2,7 @@ package media
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
@@ -72,6 +73,16 @@ func TestNewFFmpegProcessor(t *testing.T) {
 			t.Errorf("expected custom path, got %q", p.ffmpegPath)
 		}
 	})
+
+	t.Run("custom probe path", func(t *testing.T) {
+		p := NewFFmpegProcessorWithProbe("", "/usr/local/bin/ffprobe")
+		if p.ffmpegPath != "ffmpeg" {
+			t.Errorf("expected default path 'ffmpeg', got %q", p.ffmpegPath)
+		}
+		if p.ffprobePath != "/usr/local/bin/ffprobe" {
+			t.Errorf("expected custom probe path, got %q", p.ffprobePath)
+		}
+	})
 }
 
 func TestResizeImageWithPadding(t *testing.T) {
@@ -312,6 +323,109 @@ func TestJoinVideos(t *testing.T) {
 	})
 }
 
+func TestRenderStillVideo(t *testing.T) {
+	skipIfNoFFmpeg(t)
+
+	tmpDir := t.TempDir()
+	imagePath := filepath.Join(tmpDir, "image.png")
+	audioPath := filepath.Join(tmpDir, "silence.wav")
+	output := filepath.Join(tmpDir, "still.mp4")
+	createTestImage(t, imagePath, 100, 50)
+
+	cmd := exec.Command("ffmpeg", "-y", "-f", "lavfi", "-i", "anullsrc=r=16000:cl=mono:d=1.0", audioPath)
+	if out, err := cmd.CombinedOutput(); err != nil {
+		t.Fatalf("failed to create test audio: %v\noutput: %s", err, out)
+	}
+
+	p := NewFFmpegProcessor("")
+	if err := p.RenderStillVideo(context.Background(), imagePath, audioPath, output, 64, 96); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	verifyImageDimensions(t, output, 64, 96)
+	if duration := getVideoDuration(t, output); duration < 0.9 || duration > 1.2 {
+		t.Errorf("expected ~1s video, got %.2fs", duration)
+	}
+
+	if err := p.RenderStillVideo(context.Background(), imagePath, audioPath, output, 0, 96); !errors.Is(err, ErrInvalidDimensions) {
+		t.Errorf("expected ErrInvalidDimensions, got %v", err)
+	}
+}
+
+func TestBuildConcatList(t *testing.T) {
+	list, err := buildConcatList([]string{"/tmp/chunk_0.mp4", "/tmp/it's.mp4"})
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	expected := "file '/tmp/chunk_0.mp4'\nfile '/tmp/it'\\''s.mp4'\n"
+	if string(list) != expected {
+		t.Errorf("expected %q, got %q", expected, string(list))
+	}
+}
+
+func TestParseStreamParams(t *testing.T) {
+	output := `{
+		"streams": [
+			{"codec_type": "video", "codec_name": "h264", "profile": "High", "width": 384, "height": 576, "pix_fmt": "yuv420p", "r_frame_rate": "25/1"},
+			{"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2}
+		]
+	}`
+
+	sp, err := parseStreamParams([]byte(output))
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	expected := streamParams{
+		VideoCodec: "h264",
+		Profile:    "High",
+		Width:      384,
+		Height:     576,
+		PixFmt:     "yuv420p",
+		FrameRate:  "25/1",
+		AudioCodec: "aac",
+		SampleRate: "44100",
+		Channels:   2,
+	}
+	if sp != expected {
+		t.Errorf("expected %+v, got %+v", expected, sp)
+	}
+
+	if _, err := parseStreamParams([]byte("not json")); err == nil {
+		t.Error("expected error for invalid output")
+	}
+}
+
+func TestCanConcatCopy(t *testing.T) {
+	base := streamParams{VideoCodec: "h264", Width: 384, Height: 576, PixFmt: "yuv420p", FrameRate: "25/1", AudioCodec: "aac", SampleRate: "44100", Channels: 2}
+
+	resized := base
+	resized.Width = 512
+
+	resampled := base
+	resampled.SampleRate = "48000"
+
+	tests := []struct {
+		name   string
+		params []streamParams
+		want   bool
+	}{
+		{"single segment", []streamParams{base}, true},
+		{"matching segments", []streamParams{base, base, base}, true},
+		{"different resolution", []streamParams{base, resized}, false},
+		{"different sample rate", []streamParams{base, base, resampled}, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := canConcatCopy(tt.params); got != tt.want {
+				t.Errorf("canConcatCopy() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
 func TestFFmpegError(t *testing.T) {
 	err := &FFmpegError{
 		Args:   []string{"-i", "input.mp4", "-c", "copy", "output.mp4"},
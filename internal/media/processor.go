@@ -16,3 +16,12 @@ type Processor interface {
 	// with libx264/aac if the copy fails due to incompatible codecs.
 	JoinVideos(ctx context.Context, videoPaths []string, output string) error
 }
+
+// StillVideoRenderer is optionally implemented by processors that can render
+// a video of a still image over an audio track, e.g. to stand in for a
+// generated segment whose audio is silent.
+type StillVideoRenderer interface {
+	// RenderStillVideo renders the image, resized with padding to w x h, for
+	// the duration of the audio file and writes an MP4 to output.
+	RenderStillVideo(ctx context.Context, imagePath, audioPath, output string, w, h int) error
+}
@@ -1,7 +1,9 @@
 package runpod
 
 import (
+	"bytes"
 	"context"
+	"encoding/base64"
 	"encoding/json"
 	"net/http"
 	"net/http/httptest"
@@ -94,6 +96,14 @@ func TestNewClient_Success(t *testing.T) {
 	if client == nil {
 		t.Fatal("expected non-nil client")
 	}
+
+	transport, ok := client.httpClient.Transport.(*http.Transport)
+	if !ok {
+		t.Fatal("expected *http.Transport")
+	}
+	if transport.MaxIdleConnsPerHost != 16 {
+		t.Errorf("expected MaxIdleConnsPerHost 16, got %d", transport.MaxIdleConnsPerHost)
+	}
 }
 
 func TestNewClient_WithAPIKeyOption(t *testing.T) {
@@ -453,3 +463,106 @@ func TestSubmit_DefaultOptions(t *testing.T) {
 		t.Errorf("expected default Prompt 'high quality, realistic, speaking naturally', got %q", receivedReq.Input.Prompt)
 	}
 }
+
+func TestSubmit_ImageURL(t *testing.T) {
+	setTestEnv(t)
+
+	var receivedReq runRequest
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		_ = json.NewDecoder(r.Body).Decode(&receivedReq)
+		_ = json.NewEncoder(w).Encode(runResponse{ID: "job-123"})
+	}))
+	defer server.Close()
+
+	client, _ := NewClient("test-endpoint", WithBaseURL(server.URL))
+
+	opts := DefaultSubmitOptions()
+	opts.ImageURL = "https://bucket.s3.amazonaws.com/images/job.png"
+	_, err := client.Submit(context.Background(), "image-data", "audio-data", opts)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if receivedReq.Input.ImageURL != opts.ImageURL {
+		t.Errorf("expected image URL %q, got %q", opts.ImageURL, receivedReq.Input.ImageURL)
+	}
+	if receivedReq.Input.ImageBase64 != "" {
+		t.Errorf("expected no base64 image when URL is set, got %q", receivedReq.Input.ImageBase64)
+	}
+}
+
+func TestEncodeRunRequest(t *testing.T) {
+	tests := []struct {
+		name  string
+		input runInput
+	}{
+		{
+			name: "base64 payloads",
+			input: runInput{
+				runInputHeader: runInputHeader{InputType: "image", PersonCount: "single", Prompt: "a <happy> \"calm\" face", Width: 384, Height: 576, ForceOffload: true},
+				ImageBase64:    "aW1n+/==",
+				WavBase64:      "d2F2",
+			},
+		},
+		{
+			name: "image URL without inline image",
+			input: runInput{
+				runInputHeader: runInputHeader{InputType: "image", Prompt: "p", ImageURL: "https://example.com/img.png"},
+				WavBase64:      "d2F2",
+			},
+		},
+		{
+			name: "non-base64 payload falls back",
+			input: runInput{
+				runInputHeader: runInputHeader{Prompt: "p"},
+				ImageBase64:    "not\"base64\n",
+				WavBase64:      "d2F2",
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			body, err := encodeRunRequest(tt.input)
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+
+			// The fast path must produce exactly what json.Marshal would
+			want, err := json.Marshal(runRequest{Input: tt.input})
+			if err != nil {
+				t.Fatalf("json.Marshal failed: %v", err)
+			}
+			if !bytes.Equal(body, want) {
+				t.Errorf("body mismatch\n got: %s\nwant: %s", body, want)
+			}
+		})
+	}
+}
+
+func BenchmarkEncodeRunRequest(b *testing.B) {
+	payload := base64.StdEncoding.EncodeToString(bytes.Repeat([]byte{0x5a, 0xc3, 0x01}, 5<<20))
+	in := runInput{
+		runInputHeader: runInputHeader{InputType: "image", PersonCount: "single", Prompt: "high quality", Width: 384, Height: 576},
+		ImageBase64:    payload,
+		WavBase64:      payload,
+	}
+
+	b.Run("encodeRunRequest", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			if _, err := encodeRunRequest(in); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+	b.Run("json.Marshal", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			if _, err := json.Marshal(runRequest{Input: in}); err != nil {
+				b.Fatal(err)
+			}
+		}
+	})
+}
@@ -33,6 +33,7 @@ type SubmitOptions struct {
 	InputType    string // Input type (default: "image")
 	PersonCount  string // Person count (default: "single")
 	ForceOffload bool   // Whether to force offload (default: true)
+	ImageURL     string // URL of the source image; when set it is sent instead of image_base64 (the worker must support image_url)
 }
 
 // DefaultSubmitOptions returns the default options for submitting a job.
@@ -52,21 +53,29 @@ type runRequest struct {
 	Input runInput `json:"input"`
 }
 
-// runInput represents the input field in a RunPod run request.
-type runInput struct {
+// runInputHeader holds every field of runInput except the base64 payloads.
+// encodeRunRequest serializes it and appends the payloads directly after it.
+type runInputHeader struct {
 	InputType     string `json:"input_type"`
 	PersonCount   string `json:"person_count"`
 	Prompt        string `json:"prompt"`
-	ImageBase64   string `json:"image_base64"`
-	// WavBase64 contains base64-encoded WAV audio in pcm_s16le format.
-	// This format ensures maximum compatibility with PyAV/librosa decoders.
-	WavBase64     string `json:"wav_base64"`
+	ImageURL      string `json:"image_url,omitempty"`
 	Width         int    `json:"width"`
 	Height        int    `json:"height"`
 	NetworkVolume bool   `json:"network_volume"`
 	ForceOffload  bool   `json:"force_offload"`
 }
 
+// runInput represents the input field in a RunPod run request.
+// The embedded header fields are encoded inline, followed by the payloads.
+type runInput struct {
+	runInputHeader
+	ImageBase64 string `json:"image_base64,omitempty"`
+	// WavBase64 contains base64-encoded WAV audio in pcm_s16le format.
+	// This format ensures maximum compatibility with PyAV/librosa decoders.
+	WavBase64 string `json:"wav_base64"`
+}
+
 // runResponse represents the response from RunPod's /run endpoint.
 type runResponse struct {
 	ID     string `json:"id"`
@@ -100,6 +100,16 @@ func (m *mockStorage) UploadToS3(ctx context.Context, key string, data io.Reader
 	return args.String(0), args.Error(1)
 }
 
+func (m *mockStorage) PresignS3URL(ctx context.Context, key string, expires time.Duration) (string, error) {
+	args := m.Called(ctx, key, expires)
+	return args.String(0), args.Error(1)
+}
+
+func (m *mockStorage) DeleteFromS3(ctx context.Context, key string) error {
+	args := m.Called(ctx, key)
+	return args.Error(0)
+}
+
 func newTestHandlers(t *testing.T) (*Handlers, *mockProcessor, *mockSplitter, *mockRunpodClient, *mockStorage, job.Repository) {
 	t.Helper()
 	repo := job.NewMemoryRepository()
@@ -7,6 +7,7 @@ import (
 	"io"
 	"os"
 	"path/filepath"
+	"time"
 )
 
 // ErrS3NotConfigured is returned when S3 operations are attempted
@@ -112,3 +113,13 @@ func (s *LocalStorage) CleanupTemp(ctx context.Context, paths []string) error {
 func (s *LocalStorage) UploadToS3(_ context.Context, _ string, _ io.Reader) (string, error) {
 	return "", ErrS3NotConfigured
 }
+
+// PresignS3URL is not supported by LocalStorage and returns ErrS3NotConfigured.
+func (s *LocalStorage) PresignS3URL(_ context.Context, _ string, _ time.Duration) (string, error) {
+	return "", ErrS3NotConfigured
+}
+
+// DeleteFromS3 is not supported by LocalStorage and returns ErrS3NotConfigured.
+func (s *LocalStorage) DeleteFromS3(_ context.Context, _ string) error {
+	return ErrS3NotConfigured
+}
@@ -183,6 +183,18 @@ func TestLocalStorage_UploadToS3(t *testing.T) {
 	}
 }
 
+func TestLocalStorage_PresignAndDeleteS3(t *testing.T) {
+	storage := setupTestStorage(t)
+	ctx := context.Background()
+
+	if _, err := storage.PresignS3URL(ctx, "key", time.Hour); err != ErrS3NotConfigured {
+		t.Errorf("expected ErrS3NotConfigured, got %v", err)
+	}
+	if err := storage.DeleteFromS3(ctx, "key"); err != ErrS3NotConfigured {
+		t.Errorf("expected ErrS3NotConfigured, got %v", err)
+	}
+}
+
 func setupTestStorage(t *testing.T) *LocalStorage {
 	t.Helper()
 	tempDir := filepath.Join(os.TempDir(), "infinitetalk_test_"+randomSuffix())
@@ -7,6 +7,7 @@ package storage
 import (
 	"context"
 	"io"
+	"time"
 
 	mock "github.com/stretchr/testify/mock"
 )
@@ -95,6 +96,63 @@ func (_c *MockStorage_CleanupTemp_Call) RunAndReturn(run func(ctx context.Contex
 	return _c
 }
 
+// DeleteFromS3 provides a mock function for the type MockStorage
+func (_mock *MockStorage) DeleteFromS3(ctx context.Context, key string) error {
+	ret := _mock.Called(ctx, key)
+
+	if len(ret) == 0 {
+		panic("no return value specified for DeleteFromS3")
+	}
+
+	var r0 error
+	if returnFunc, ok := ret.Get(0).(func(context.Context, string) error); ok {
+		r0 = returnFunc(ctx, key)
+	} else {
+		r0 = ret.Error(0)
+	}
+	return r0
+}
+
+// MockStorage_DeleteFromS3_Call is a *mock.Call that shadows Run/Return methods with type explicit version for method 'DeleteFromS3'
+type MockStorage_DeleteFromS3_Call struct {
+	*mock.Call
+}
+
+// DeleteFromS3 is a helper method to define mock.On call
+//   - ctx context.Context
+//   - key string
+func (_e *MockStorage_Expecter) DeleteFromS3(ctx interface{}, key interface{}) *MockStorage_DeleteFromS3_Call {
+	return &MockStorage_DeleteFromS3_Call{Call: _e.mock.On("DeleteFromS3", ctx, key)}
+}
+
+func (_c *MockStorage_DeleteFromS3_Call) Run(run func(ctx context.Context, key string)) *MockStorage_DeleteFromS3_Call {
+	_c.Call.Run(func(args mock.Arguments) {
+		var arg0 context.Context
+		if args[0] != nil {
+			arg0 = args[0].(context.Context)
+		}
+		var arg1 string
+		if args[1] != nil {
+			arg1 = args[1].(string)
+		}
+		run(
+			arg0,
+			arg1,
+		)
+	})
+	return _c
+}
+
+func (_c *MockStorage_DeleteFromS3_Call) Return(err error) *MockStorage_DeleteFromS3_Call {
+	_c.Call.Return(err)
+	return _c
+}
+
+func (_c *MockStorage_DeleteFromS3_Call) RunAndReturn(run func(ctx context.Context, key string) error) *MockStorage_DeleteFromS3_Call {
+	_c.Call.Return(run)
+	return _c
+}
+
 // LoadTemp provides a mock function for the type MockStorage
 func (_mock *MockStorage) LoadTemp(ctx context.Context, path string) (io.ReadCloser, error) {
 	ret := _mock.Called(ctx, path)
@@ -163,6 +221,78 @@ func (_c *MockStorage_LoadTemp_Call) RunAndReturn(run func(ctx context.Context,
 	return _c
 }
 
+// PresignS3URL provides a mock function for the type MockStorage
+func (_mock *MockStorage) PresignS3URL(ctx context.Context, key string, expires time.Duration) (string, error) {
+	ret := _mock.Called(ctx, key, expires)
+
+	if len(ret) == 0 {
+		panic("no return value specified for PresignS3URL")
+	}
+
+	var r0 string
+	var r1 error
+	if returnFunc, ok := ret.Get(0).(func(context.Context, string, time.Duration) (string, error)); ok {
+		return returnFunc(ctx, key, expires)
+	}
+	if returnFunc, ok := ret.Get(0).(func(context.Context, string, time.Duration) string); ok {
+		r0 = returnFunc(ctx, key, expires)
+	} else {
+		r0 = ret.Get(0).(string)
+	}
+	if returnFunc, ok := ret.Get(1).(func(context.Context, string, time.Duration) error); ok {
+		r1 = returnFunc(ctx, key, expires)
+	} else {
+		r1 = ret.Error(1)
+	}
+	return r0, r1
+}
+
+// MockStorage_PresignS3URL_Call is a *mock.Call that shadows Run/Return methods with type explicit version for method 'PresignS3URL'
+type MockStorage_PresignS3URL_Call struct {
+	*mock.Call
+}
+
+// PresignS3URL is a helper method to define mock.On call
+//   - ctx context.Context
+//   - key string
+//   - expires time.Duration
+func (_e *MockStorage_Expecter) PresignS3URL(ctx interface{}, key interface{}, expires interface{}) *MockStorage_PresignS3URL_Call {
+	return &MockStorage_PresignS3URL_Call{Call: _e.mock.On("PresignS3URL", ctx, key, expires)}
+}
+
+func (_c *MockStorage_PresignS3URL_Call) Run(run func(ctx context.Context, key string, expires time.Duration)) *MockStorage_PresignS3URL_Call {
+	_c.Call.Run(func(args mock.Arguments) {
+		var arg0 context.Context
+		if args[0] != nil {
+			arg0 = args[0].(context.Context)
+		}
+		var arg1 string
+		if args[1] != nil {
+			arg1 = args[1].(string)
+		}
+		var arg2 time.Duration
+		if args[2] != nil {
+			arg2 = args[2].(time.Duration)
+		}
+		run(
+			arg0,
+			arg1,
+			arg2,
+		)
+	})
+	return _c
+}
+
+func (_c *MockStorage_PresignS3URL_Call) Return(url string, err error) *MockStorage_PresignS3URL_Call {
+	_c.Call.Return(url, err)
+	return _c
+}
+
+func (_c *MockStorage_PresignS3URL_Call) RunAndReturn(run func(ctx context.Context, key string, expires time.Duration) (string, error)) *MockStorage_PresignS3URL_Call {
+	_c.Call.Return(run)
+	return _c
+}
+
 // SaveTemp provides a mock function for the type MockStorage
 func (_mock *MockStorage) SaveTemp(ctx context.Context, name string, data io.Reader) (string, error) {
 	ret := _mock.Called(ctx, name, data)
@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"io"
+	"time"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/config"
@@ -85,3 +86,27 @@ func (s *S3Storage) UploadToS3(ctx context.Context, key string, data io.Reader)
 	url := fmt.Sprintf("https://%s.s3.%s.amazonaws.com/%s", s.bucket, s.region, key)
 	return url, nil
 }
+
+// PresignS3URL returns a presigned GET URL for key that is valid for expires.
+func (s *S3Storage) PresignS3URL(ctx context.Context, key string, expires time.Duration) (string, error) {
+	req, err := s3.NewPresignClient(s.client).PresignGetObject(ctx, &s3.GetObjectInput{
+		Bucket: aws.String(s.bucket),
+		Key:    aws.String(key),
+	}, s3.WithPresignExpires(expires))
+	if err != nil {
+		return "", fmt.Errorf("presign S3 URL: %w", err)
+	}
+	return req.URL, nil
+}
+
+// DeleteFromS3 deletes the object stored under key.
+func (s *S3Storage) DeleteFromS3(ctx context.Context, key string) error {
+	_, err := s.client.DeleteObject(ctx, &s3.DeleteObjectInput{
+		Bucket: aws.String(s.bucket),
+		Key:    aws.String(key),
+	})
+	if err != nil {
+		return fmt.Errorf("delete from S3: %w", err)
+	}
+	return nil
+}
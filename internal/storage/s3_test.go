@@ -10,6 +10,7 @@ import (
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestNewS3Storage(t *testing.T) {
@@ -135,3 +136,65 @@ func TestS3Storage_UploadToS3_MockServer(t *testing.T) {
 		t.Errorf("url = %v, want %v", url, expectedURL)
 	}
 }
+
+func TestS3Storage_PresignS3URL(t *testing.T) {
+	tempDir := filepath.Join(os.TempDir(), "infinitetalk_s3_presign_test_"+randomSuffix())
+	defer func() { _ = os.RemoveAll(tempDir) }()
+
+	cfg := S3Config{
+		Bucket:          "test-bucket",
+		Region:          "us-east-1",
+		Endpoint:        "http://localhost:4566",
+		AccessKeyID:     "test-access-key",
+		SecretAccessKey: "test-secret-key",
+	}
+
+	storage, err := NewS3Storage(tempDir, cfg)
+	if err != nil {
+		t.Fatalf("NewS3Storage() error = %v", err)
+	}
+
+	url, err := storage.PresignS3URL(context.Background(), "images/job.png", 15*time.Minute)
+	if err != nil {
+		t.Fatalf("PresignS3URL() error = %v", err)
+	}
+
+	for _, want := range []string{"/test-bucket/images/job.png", "X-Amz-Signature=", "X-Amz-Expires=900"} {
+		if !strings.Contains(url, want) {
+			t.Errorf("url %q does not contain %q", url, want)
+		}
+	}
+}
+
+func TestS3Storage_DeleteFromS3_MockServer(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method != http.MethodDelete {
+			t.Errorf("expected DELETE method, got %s", r.Method)
+		}
+		if !strings.Contains(r.URL.Path, "/images/job.png") {
+			t.Errorf("unexpected path: %s", r.URL.Path)
+		}
+		w.WriteHeader(http.StatusNoContent)
+	}))
+	defer server.Close()
+
+	tempDir := filepath.Join(os.TempDir(), "infinitetalk_s3_delete_test_"+randomSuffix())
+	defer func() { _ = os.RemoveAll(tempDir) }()
+
+	cfg := S3Config{
+		Bucket:          "test-bucket",
+		Region:          "us-east-1",
+		Endpoint:        server.URL,
+		AccessKeyID:     "test-access-key",
+		SecretAccessKey: "test-secret-key",
+	}
+
+	storage, err := NewS3Storage(tempDir, cfg)
+	if err != nil {
+		t.Fatalf("NewS3Storage() error = %v", err)
+	}
+
+	if err := storage.DeleteFromS3(context.Background(), "images/job.png"); err != nil {
+		t.Fatalf("DeleteFromS3() error = %v", err)
+	}
+}
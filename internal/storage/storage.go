@@ -6,6 +6,7 @@ package storage
 import (
 	"context"
 	"io"
+	"time"
 )
 
 // Storage defines the interface for temporary and persistent file storage.
@@ -27,4 +28,13 @@ type Storage interface {
 	// UploadToS3 uploads data to S3 and returns the public URL.
 	// Returns ErrS3NotConfigured if S3 is not configured.
 	UploadToS3(ctx context.Context, key string, data io.Reader) (url string, err error)
+
+	// PresignS3URL returns a time-limited GET URL for an uploaded object, so it
+	// can be fetched without bucket credentials.
+	// Returns ErrS3NotConfigured if S3 is not configured.
+	PresignS3URL(ctx context.Context, key string, expires time.Duration) (url string, err error)
+
+	// DeleteFromS3 removes an uploaded object.
+	// Returns ErrS3NotConfigured if S3 is not configured.
+	DeleteFromS3(ctx context.Context, key string) error
 }
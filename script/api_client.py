@@ -10,29 +10,97 @@ import sys
 import time
 import json
 import base64
+import binascii
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: much faster encoding of large base64 payloads
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env
 load_dotenv()
 
 # Configuration
 API_URL = os.getenv("INFINITETALK_API_URL", "http://localhost:8080")
 
+# Shared HTTP session so submit, poll and download calls reuse pooled
+# connections. Retries only apply to idempotent methods (not job creation).
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 def file_to_base64(path):
-    """Convert a file to base64 encoding."""
+    """Base64-encode a file into a pre-sized bytearray, reading it in chunks.
+
+    The result is ASCII bytes rather than a str, so the encoded data exists
+    only once: create_job streams it into the request body as-is.
+    """
+    # Chunk size is a multiple of 3 so no padding is emitted mid-stream
+    chunk_size = 57 * 1024
+    encoded = bytearray(4 * ((os.path.getsize(path) + 2) // 3))
+    offset = 0
     with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+        while chunk := f.read(chunk_size):
+            piece = binascii.b2a_base64(chunk, newline=False)
+            encoded[offset:offset + len(piece)] = piece
+            offset += len(piece)
+    del encoded[offset:]  # The file may have shrunk since it was sized
+    return encoded
+
+def write_base64_to_file(data_b64, output_path):
+    """Decode a base64 string into a file chunk by chunk."""
+    # Chunk size is a multiple of 4 so every slice decodes on its own
+    chunk_size = 64 * 1024
+    with open(output_path, "wb") as f:
+        for i in range(0, len(data_b64), chunk_size):
+            f.write(base64.b64decode(data_b64[i:i + chunk_size]))
+
+def dumps_json(payload):
+    """Serialize a request payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+def iter_json_body(payloads, fields, chunk_size=64 * 1024):
+    """Yield a JSON object body made of base64 payloads plus small fields.
+
+    payloads maps keys to base64 bytes, which need no escaping and are sent
+    in slices instead of being copied into one full-size serialized body.
+    """
+    prefix = b"{"
+    for key, data in payloads.items():
+        yield prefix + f'"{key}":"'.encode("ascii")
+        view = memoryview(data)
+        for i in range(0, len(view), chunk_size):
+            yield bytes(view[i:i + chunk_size])
+        yield b'"'
+        prefix = b","
+    # dumps_json output starts with "{"; continue the object after the payloads
+    yield prefix + dumps_json(fields)[1:]
 
 def create_job(api_url, image_b64, audio_b64, width, height, provider, push_to_s3, dry_run):
-    """Create a new job via the API."""
+    """Create a new job via the API.
+
+    image_b64 and audio_b64 are base64 bytes as returned by file_to_base64.
+    """
     url = f"{api_url}/jobs"
 
-    payload = {
+    payloads = {
         "image_base64": image_b64,
         "audio_base64": audio_b64,
+    }
+    fields = {
         "width": width,
         "height": height,
         "provider": provider,
@@ -45,7 +113,8 @@ def create_job(api_url, image_b64, audio_b64, width, height, provider, push_to_s
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        # A generator body is sent with chunked transfer encoding
+        response = SESSION.post(url, data=iter_json_body(payloads, fields), headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -59,15 +128,19 @@ def get_job_status(api_url, job_id):
     url = f"{api_url}/jobs/{job_id}"
 
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         print(f"❌ Error getting job status: {e}")
         sys.exit(1)
 
-def poll_job_until_complete(api_url, job_id, poll_interval=5, timeout=600):
-    """Poll the job status until it's complete or failed."""
+def poll_job_until_complete(api_url, job_id, poll_interval=1, timeout=600, max_poll_interval=30):
+    """Poll the job status until it's complete or failed.
+
+    The delay between polls starts at poll_interval and grows by 1.5x per
+    poll up to max_poll_interval.
+    """
     print("⏳ Waiting for job completion...")
 
     start_time = time.time()
@@ -75,6 +148,7 @@ def poll_job_until_complete(api_url, job_id, poll_interval=5, timeout=600):
 
     last_progress = 0
     last_status = ""
+    delay = poll_interval
 
     while True:
         # Check timeout
@@ -115,8 +189,9 @@ def poll_job_until_complete(api_url, job_id, poll_interval=5, timeout=600):
                 print(f"Error: {error}")
             sys.exit(1)
 
-        # Wait before next poll
-        time.sleep(poll_interval)
+        # Wait before next poll, backing off exponentially
+        time.sleep(delay)
+        delay = min(delay * 1.5, max_poll_interval)
 
 def save_video_output(job_info, output_path):
     """Save the video output from job info."""
@@ -125,7 +200,7 @@ def save_video_output(job_info, output_path):
     if video_url:
         print(f"📥 Downloading video from S3: {video_url}")
         try:
-            response = requests.get(video_url, stream=True, timeout=60)
+            response = SESSION.get(video_url, stream=True, timeout=60)
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
@@ -152,9 +227,7 @@ def save_video_output(job_info, output_path):
     if video_b64:
         print(f"💾 Decoding base64 video...")
         try:
-            video_data = base64.b64decode(video_b64)
-            with open(output_path, 'wb') as f:
-                f.write(video_data)
+            write_base64_to_file(video_b64, output_path)
             print(f"✅ Video saved to {output_path}")
             return
         except Exception as e:
@@ -228,8 +301,10 @@ Examples:
     # API configuration
     parser.add_argument("--api-url", default=API_URL,
                         help=f"Infinitetalk API URL (default: {API_URL})")
-    parser.add_argument("--poll-interval", type=int, default=5,
-                        help="Status polling interval in seconds (default: 5)")
+    parser.add_argument("--poll-interval", type=float, default=1,
+                        help="Initial status polling interval in seconds (default: 1)")
+    parser.add_argument("--max-poll-interval", type=float, default=30,
+                        help="Maximum status polling interval in seconds (default: 30)")
     parser.add_argument("--timeout", type=int, default=7200,
                         help="Job timeout in seconds (default: 7200)")
 
@@ -276,7 +351,8 @@ Examples:
         args.api_url,
         job_id,
         poll_interval=args.poll_interval,
-        timeout=args.timeout
+        timeout=args.timeout,
+        max_poll_interval=args.max_poll_interval
     )
 
     # Save output video